@@ -0,0 +1,258 @@
+"""
+Bounded, thread-safe caches for values derived from the dataframes D-Tale is serving (sort orders, filtered views,
+summaries...).  Entries are stored per data_id and remember which dataframe they were built from (along with a
+signature of its contents), so an entry is never returned once the data behind a data_id has been swapped out or
+edited in place.
+"""
+import hashlib
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+CACHES = []
+
+
+def sizeof(value):
+    """
+    Rough estimate of the number of bytes held by a cached value.  Numpy/pandas objects report the size of their
+    buffers and containers are summed recursively.
+
+    :param value: any object
+    :return: estimated size in bytes
+    :rtype: int
+    """
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=False))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def data_signature(data, sample_size=1000):
+    """
+    Cheap signature of a dataframe's contents used to detect in-place edits (EX: d.data['a'] = 'foo'). It combines
+    the shape, column names & dtypes with a hash of up to `sample_size` evenly spaced rows, so edits to rows outside
+    of the sample aren't detected.
+
+    :param data: dataframe
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param sample_size: maximum number of rows hashed
+    :type sample_size: int
+    :return: signature
+    :rtype: tuple
+    """
+    if not isinstance(data, pd.DataFrame):
+        return None
+    positions = np.unique(np.linspace(0, len(data) - 1, min(len(data), sample_size)).astype('int64'))
+    sample = data.iloc[positions]
+    try:
+        hashes = pd.util.hash_pandas_object(sample, index=True).values
+    except TypeError:  # unhashable values (lists, dicts...) get hashed by their string representation
+        hashes = pd.util.hash_pandas_object(sample.astype(str), index=True).values
+    digest = hashlib.md5(np.ascontiguousarray(hashes).tobytes()).hexdigest()
+    return data.shape, tuple(str(c) for c in data.columns), tuple(str(d) for d in data.dtypes), digest
+
+
+def _ref(data):
+    if data is None:
+        return None
+    try:
+        return weakref.ref(data)
+    except TypeError:
+        return lambda: data
+
+
+class DataCache(object):
+    """
+    Least-recently-used cache of values keyed by (data_id, key), bounded by number of entries and/or estimated
+    bytes.  When an entry is stored along with the dataframe it was built from, lookups will only succeed while that
+    same dataframe is still the one being passed in and its :meth:`dtale.cache.data_signature` hasn't changed.
+
+    :param name: label for this cache
+    :type name: str
+    :param max_entries: maximum number of entries held, `None` for unbounded
+    :type max_entries: int, optional
+    :param max_bytes: maximum estimated number of bytes held, `None` for unbounded
+    :type max_bytes: int, optional
+    """
+
+    def __init__(self, name, max_entries=None, max_bytes=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        CACHES.append(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, data_id, key, data=None, default=None):
+        """
+        Retrieve a value, marking it as most recently used
+
+        :param data_id: integer string identifier for a D-Tale process's data
+        :type data_id: str
+        :param key: hashable key for this value
+        :param data: dataframe the value should have been built from
+        :type data: :class:`pandas:pandas.DataFrame`, optional
+        :param default: value returned when there is no valid entry
+        :return: cached value or default
+        """
+        return self._get(data_id, key, data, default)
+
+    def _get(self, data_id, key, data, default, signature=None):
+        cache_key = (data_id, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return default
+            ref, entry_signature, value, size = entry
+            if data is not None:
+                if ref is None or ref() is not data:
+                    self._pop(cache_key)
+                    return default
+                if entry_signature != (data_signature(data) if signature is None else signature):
+                    self._pop(cache_key)
+                    return default
+            self._entries[cache_key] = self._entries.pop(cache_key)  # mark as most recently used
+            return value
+
+    def set(self, data_id, key, value, data=None):
+        """
+        Store a value, evicting least-recently-used entries until the cache is back within its bounds.  Values larger
+        than `max_bytes` on their own are not stored.
+
+        :param data_id: integer string identifier for a D-Tale process's data
+        :type data_id: str
+        :param key: hashable key for this value
+        :param value: value to store
+        :param data: dataframe the value was built from
+        :type data: :class:`pandas:pandas.DataFrame`, optional
+        :return: value
+        """
+        return self._set(data_id, key, value, data)
+
+    def _set(self, data_id, key, value, data, signature=None):
+        cache_key = (data_id, key)
+        size = sizeof(value)
+        if data is not None and signature is None:
+            signature = data_signature(data)
+        with self._lock:
+            self._pop(cache_key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return value
+            self._entries[cache_key] = (_ref(data), signature, value, size)
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def get_or_build(self, data_id, key, builder, data=None):
+        """
+        Retrieve a value or build & store it if there is no valid entry
+
+        :param data_id: integer string identifier for a D-Tale process's data
+        :type data_id: str
+        :param key: hashable key for this value
+        :param builder: function with no arguments which builds the value
+        :type builder: func
+        :param data: dataframe the value is built from
+        :type data: :class:`pandas:pandas.DataFrame`, optional
+        :return: cached or newly built value
+        """
+        missing = object()
+        signature = None if data is None else data_signature(data)
+        value = self._get(data_id, key, data, missing, signature=signature)
+        if value is missing:
+            value = self._set(data_id, key, builder(), data, signature=signature)
+        return value
+
+    def resize(self, max_entries=None, max_bytes=None):
+        """
+        Update the bounds of this cache, evicting least-recently-used entries until it is within them
+
+        :param max_entries: maximum number of entries held, `None` for unbounded
+        :type max_entries: int, optional
+        :param max_bytes: maximum estimated number of bytes held, `None` for unbounded
+        :type max_bytes: int, optional
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self, data_id=None):
+        """
+        Drop all entries or only the entries for a specific data_id
+
+        :param data_id: integer string identifier for a D-Tale process's data
+        :type data_id: str, optional
+        """
+        with self._lock:
+            if data_id is None:
+                self._entries.clear()
+                self.nbytes = 0
+                return
+            for cache_key in [k for k in self._entries if k[0] == data_id]:
+                self._pop(cache_key)
+
+    def _evict(self):
+        while len(self._entries) and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            self._pop(next(iter(self._entries)))
+
+    def _pop(self, cache_key):
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self.nbytes -= entry[3]
+
+
+def clear_caches(data_id=None):
+    """
+    Drop entries from every :class:`dtale.cache.DataCache`, either all of them or only the ones for a specific
+    data_id.  This is called whenever data is loaded, replaced or cleaned up.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str, optional
+    """
+    for cache in CACHES:
+        cache.clear(data_id)
+
+
+def configure_cache(name, max_entries=None, max_bytes=None):
+    """
+    Update the bounds of the :class:`dtale.cache.DataCache` registered under a name
+
+    :Example:
+
+        >>> import dtale.cache
+        >>> dtale.cache.configure_cache('correlations', max_bytes=1024 ** 3)
+
+    :param name: name of the cache (EX: 'sort', 'view', 'describe', 'histogram', 'correlations')
+    :type name: str
+    :param max_entries: maximum number of entries held, `None` for unbounded
+    :type max_entries: int, optional
+    :param max_bytes: maximum estimated number of bytes held, `None` for unbounded
+    :type max_bytes: int, optional
+    """
+    caches = [cache for cache in CACHES if cache.name == name]
+    if not caches:
+        raise ValueError('no cache named {}'.format(name))
+    for cache in caches:
+        cache.resize(max_entries=max_entries, max_bytes=max_bytes)
@@ -1,10 +1,16 @@
+import numpy as np
 import pandas as pd
 
+from dtale.cache import DataCache
 from dtale.utils import (classify_type, find_dtype_formatter, get_dtypes,
                          grid_columns, grid_formatter, json_int, make_list)
 
 YAXIS_CHARTS = ['line', 'bar', 'scatter']
 ZAXIS_CHARTS = ['heatmap', '3d_scatter', 'surface']
+# date frequency buckets (see build_date_freq) per data_id, column & frequency, bounded to ~512MB
+DATE_FREQ_CACHE = DataCache('date_freq', max_bytes=512 * 1024 ** 2)
+# output of build_chart per data_id & chart inputs (see chart_cache_key), bounded to ~256MB
+CHART_CACHE = DataCache('chart', max_entries=100, max_bytes=256 * 1024 ** 2)
 
 
 def valid_chart(chart_type=None, x=None, y=None, z=None, **inputs):
@@ -49,7 +55,57 @@ def build_formatters(df):
     return data_f, range_f
 
 
-def date_freq_handler(df):
+def build_date_freq(dates, freq):
+    """
+    Buckets the values of a datetime series by frequency.  The buckets are computed once per distinct date and then
+    mapped back to each row, since datetime columns usually contain far fewer dates than rows.
+
+    :param dates: datetime data
+    :type dates: :class:`pandas:pandas.Series`
+    :param freq: 'WD' (day of week), 'H2' (hour of day) or a period frequency (EX: 'D', 'W', 'M', 'Q', 'Y')
+    :type freq: str
+    :return: bucket of each row, NaN/NaT for missing dates
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    codes, uniques = pd.factorize(dates)
+    uniques = pd.Series(uniques)
+    if freq == 'WD':
+        buckets = uniques.dt.dayofweek.values
+    elif freq == 'H2':
+        buckets = uniques.dt.hour.values
+    else:
+        buckets = uniques.dt.to_period(freq).dt.to_timestamp(how='end').values
+    return pd.Series(buckets).reindex(codes).values
+
+
+def date_freq_memo(data_id, data):
+    """
+    Builds a memo for :meth:`dtale.charts.utils.date_freq_handler` which computes the frequency buckets of a column
+    over all of a D-Tale process's data once per column & frequency (held in
+    :attr:`dtale.charts.utils.DATE_FREQ_CACHE`) and returns them for that data or any subset of its rows (like the
+    output of a query), so switching between charts of the same buckets doesn't recompute them.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data: all the data of this process
+    :type data: :class:`pandas:pandas.DataFrame`
+    :return: function of (dataframe, column, frequency) returning buckets aligned with the dataframe or `None` if the
+             dataframe's rows can't be located within `data`
+    :rtype: func
+    """
+    positional = isinstance(data.index, pd.RangeIndex) and data.index.start == 0 and data.index.step == 1
+
+    def _memo(df, col, freq):
+        if df is not data and not positional:
+            return None
+        buckets = DATE_FREQ_CACHE.get_or_build(
+            data_id, (col, freq), lambda: build_date_freq(data[col], freq), data=data
+        )
+        return buckets if df is data else buckets[df.index.values]
+    return _memo
+
+
+def date_freq_handler(df, memo=None):
     """
     This returns a column definition handler which returns a series based on the specs from the front-end.
     Column definitions can be a column name 'Col1' or a column name with a frequency 'Col1|M' for
@@ -61,6 +117,9 @@ def date_freq_handler(df):
 
     :param df: dataframe whose data needs to be checked
     :type df: :class:`pandas:pandas.DataFrame`
+    :param memo: function returning previously computed frequency buckets (see
+                 :meth:`dtale.charts.utils.date_freq_memo`)
+    :type memo: func, optional
     :return: handler function
     :rtype: func
     """
@@ -71,19 +130,16 @@ def date_freq_handler(df):
         col_def_segs = col_def.split('|')
         if len(col_def_segs) > 1 and classify_type(dtypes[col_def_segs[0]]) == 'D':
             col, freq = col_def_segs
-            if freq == 'WD':
-                freq_grp = df.set_index(col).index.dayofweek.values
-            elif freq == 'H2':
-                freq_grp = df.set_index(col).index.hour.values
-            else:
-                freq_grp = df.set_index(col).index.to_period(freq).to_timestamp(how='end').values
+            freq_grp = memo(df, col, freq) if memo is not None else None
+            if freq_grp is None:
+                freq_grp = build_date_freq(df[col], freq)
             freq_grp = pd.Series(freq_grp, index=orig_idx, name=col_def)
             return freq_grp
         return df[col_def]
     return _handler
 
 
-def retrieve_chart_data(df, x, y, z, group=None):
+def retrieve_chart_data(df, x, y, z, group=None, freq_memo=None):
     """
     Retrieves data from a dataframe for x, y, z & group inputs complete with date frequency
     formatting (:meth:`dtale.charts.utils.date_freq_handler`) if specified
@@ -98,10 +154,12 @@ def retrieve_chart_data(df, x, y, z, group=None):
     :type z: str
     :param group: column(s) to use for grouping
     :type group: list of str or str
+    :param freq_memo: memo of date frequency buckets (see :meth:`dtale.charts.utils.date_freq_memo`)
+    :type freq_memo: func, optional
     :return: dataframe of data required for chart constructiuon
     :rtype: :class:`pandas:pandas.DataFrame`
     """
-    freq_handler = date_freq_handler(df)
+    freq_handler = date_freq_handler(df, memo=freq_memo)
     cols = [x] + make_list(y) + [z] + make_list(group)
     return pd.concat([freq_handler(c) for c in cols if c is not None], axis=1)
 
@@ -121,6 +179,29 @@ def check_all_nan(df, cols=None):
             raise Exception('All data for column "{}" is NaN!'.format(col))
 
 
+def has_duplicates(df):
+    """
+    Checker function to test whether any rows of a dataframe are duplicated.  Dataframes of one or two columns (the
+    usual x-axis or x & y-axis checks) are factorized into integer codes which are combined into a single code per row
+    and sorted, rather than hashing each row & materializing a series of flags like
+    :meth:`pandas:pandas.DataFrame.duplicated`.  Missing values are considered equal to each other.
+
+    :param df: dataframe whose data needs to be checked
+    :type df: :class:`pandas:pandas.DataFrame`
+    :return: `True` if any row is duplicated, `False` otherwise
+    :rtype: bool
+    """
+    if len(df.columns) > 2 or not len(df.columns):
+        return bool(df.duplicated().any())
+    combined = np.zeros(len(df), dtype='int64')
+    for i in range(len(df.columns)):
+        codes, uniques = pd.factorize(df.iloc[:, i])
+        codes[codes == -1] = len(uniques)
+        combined = combined * (len(uniques) + 1) + codes
+    combined.sort()
+    return bool((combined[1:] == combined[:-1]).any())
+
+
 LIMIT_MSG = 'Dataset exceeds {} records, cannot render. Please apply filter...'
 
 
@@ -141,11 +222,11 @@ def check_exceptions(df, allow_duplicates, data_limit=15000, limit_msg=LIMIT_MSG
     :type limit_msg: str, optional
     :raises Exception: if any failure condition is met
     """
-    if not allow_duplicates and any(df.duplicated()):
-        raise Exception(
-            '{} contains duplicates, please specify group or additional filtering'.format(', '.join(df.columns)))
     if len(df) > data_limit:
         raise Exception(limit_msg.format(data_limit))
+    if not allow_duplicates and has_duplicates(df):
+        raise Exception(
+            '{} contains duplicates, please specify group or additional filtering'.format(', '.join(df.columns)))
 
 
 def build_agg_data(df, x, y, inputs, agg, z=None):
@@ -189,6 +270,40 @@ def build_agg_data(df, x, y, inputs, agg, z=None):
     return getattr(groups[y], agg)().reset_index()
 
 
+def downsample_positions(df, y, max_points):
+    """
+    Min/max-per-bucket downsampling of line chart data which is sorted by its x-axis.  Rows are split into buckets of
+    consecutive x-axis values and each bucket keeps its first & last row along with the rows holding the minimum &
+    maximum of each y-axis column, so the shape of every series (including any spikes) is preserved with at most
+    `max_points` rows.
+
+    :param df: chart data sorted by its x-axis
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param y: columns to use for the Y-Axes
+    :type y: list of str
+    :param max_points: maximum number of rows to keep
+    :type max_points: int
+    :return: sorted positions of the rows kept
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    total = len(df)
+    y = make_list(y)
+    if total <= max_points:
+        return np.arange(total)
+    buckets = max(max_points // (2 + 2 * len(y)), 1)
+    bucket_ids = np.arange(total) * buckets // total
+    starts = np.searchsorted(bucket_ids, np.arange(buckets), side='left')
+    ends = np.append(starts[1:], total)
+    kept = [starts, ends - 1]
+    for col in y:
+        values = df[col].values
+        if values.dtype.kind not in 'iufbM':
+            continue
+        order = np.lexsort((values, bucket_ids))
+        kept += [order[starts], order[ends - 1]]
+    return np.unique(np.concatenate(kept))
+
+
 def build_chart(raw_data, x, y, group_col=None, agg=None, allow_duplicates=False, **kwargs):
     """
     Helper function to return data for 'chart-data' & 'correlations-ts' endpoints.  Will return a dictionary of
@@ -210,10 +325,14 @@ def build_chart(raw_data, x, y, group_col=None, agg=None, allow_duplicates=False
     :type agg: str, optional
     :param allow_duplicates: flag to allow duplicates to be ignored (usually for scatter plots)
     :type allow_duplicates: bool, optional
+    :param kwargs: optional keyword arguments, such as 'downsample' which (for charts without a Z-Axis) will reduce
+                   data exceeding the data limit using :meth:`dtale.charts.utils.downsample_positions` rather than
+                   raising an exception and set 'sampled' in the output
+    :type kwargs: dict
     :return: dict
     """
 
-    data = retrieve_chart_data(raw_data, x, y, kwargs.get('z'), group_col)
+    data = retrieve_chart_data(raw_data, x, y, kwargs.get('z'), group_col, freq_memo=kwargs.get('freq_memo'))
     x_col = str('x')
     y_cols = make_list(y)
     z_col = kwargs.get('z')
@@ -246,11 +365,19 @@ def build_chart(raw_data, x, y, group_col=None, agg=None, allow_duplicates=False
         dtypes = get_dtypes(data)
         group_fmt_overrides = {'I': lambda v, as_string: json_int(v, as_string=as_string, fmt='{}')}
         group_fmts = {c: find_dtype_formatter(dtypes[c], overrides=group_fmt_overrides) for c in group_col}
-        for group_val, grp in data.groupby(group_col):
-            group_val = '/'.join([
-                group_fmts[gc](gv, as_string=True) for gv, gc in zip(make_list(group_val), group_col)
-            ])
-            ret_data['data'][group_val] = data_f.format_lists(grp)
+        # data is already ordered by group so each group's series are slices of a single formatting pass
+        group_codes = np.zeros(len(data), dtype='int64')
+        for gc in group_col:
+            codes, uniques = pd.factorize(data[gc])
+            group_codes = group_codes * len(uniques) + codes
+        starts = np.flatnonzero(np.diff(group_codes)) + 1
+        starts = np.append([0], starts) if len(data) else starts
+        ends = np.append(starts[1:], len(data))
+        formatted = data_f.format_df_columns(data)
+        group_vals = data[group_col].values
+        for start, end in zip(starts, ends):
+            group_val = '/'.join([group_fmts[gc](gv, as_string=True) for gv, gc in zip(group_vals[start], group_col)])
+            ret_data['data'][group_val] = {col: vals[start:end] for col, vals in formatted.items()}
         ret_data['dtypes'] = {c: classify_type(dtype) for c, dtype in dtypes.items()}
         return ret_data
     sort_cols = [x] + (y_cols if len(z_cols) else [])
@@ -263,17 +390,82 @@ def build_chart(raw_data, x, y, group_col=None, agg=None, allow_duplicates=False
     data = data.dropna()
 
     dupe_cols = [x_col] + (y_cols if len(z_cols) else [])
+    # aggregations (other than rolling) group by these columns so their output can't contain duplicates
+    allow_duplicates = allow_duplicates or agg not in [None, 'rolling']
+    data_limit = 40000 if len(z_cols) else 15000
+    sampled = kwargs.get('downsample', False) and not len(z_cols) and len(data) > data_limit
     check_exceptions(data[dupe_cols].rename(columns={'x': x}), allow_duplicates,
-                     data_limit=40000 if len(z_cols) else 15000)
+                     data_limit=len(data) if sampled else data_limit)
+    if sampled:
+        data = data.iloc[downsample_positions(data, y_cols, data_limit)]
     data_f, range_f = build_formatters(data)
     ret_data = dict(
-        data={str('all'): data_f.format_lists(data)},
+        data={str('all'): data_f.format_df_columns(data)},
         min={col: fmt(data[col].min(), None) for _, col, fmt in range_f.fmts if col in [x_col] + y_cols + z_cols},
         max={col: fmt(data[col].max(), None) for _, col, fmt in range_f.fmts if col in [x_col] + y_cols + z_cols}
     )
+    if sampled:
+        ret_data['sampled'] = True
     return ret_data
 
 
+def chart_cache_key(query=None, x=None, y=None, z=None, group=None, agg=None, window=None, rolling_comp=None,
+                    allow_duplicates=False, downsample=False):
+    """
+    Builds the key of the output of :meth:`dtale.charts.utils.build_chart` for a set of chart inputs within
+    :attr:`dtale.charts.utils.CHART_CACHE`.  Inputs are normalized so equivalent requests (EX: no query & an empty
+    query, rolling inputs when the aggregation isn't rolling) share an entry and cosmetic inputs (axis ranges, bar
+    modes...) are left out entirely.
+
+    :param query: pandas dataframe query string
+    :type query: str, optional
+    :param x: column to use for the X-Axis
+    :type x: str
+    :param y: columns to use for the Y-Axes
+    :type y: list of str
+    :param z: column to use for the Z-Axis
+    :type z: str, optional
+    :param group: column(s) to use for grouping
+    :type group: list of str or str, optional
+    :param agg: aggregation applied to y or z axes
+    :type agg: str, optional
+    :param window: number of days to include in rolling aggregations
+    :type window: int, optional
+    :param rolling_comp: computation to use in rolling aggregations
+    :type rolling_comp: str, optional
+    :param allow_duplicates: flag to allow duplicates to be ignored (usually for scatter plots)
+    :type allow_duplicates: bool, optional
+    :param downsample: flag to downsample data exceeding the data limit (usually for line charts)
+    :type downsample: bool, optional
+    :return: hashable key
+    :rtype: tuple
+    """
+    query = (query or '').strip() or None
+    if agg != 'rolling':
+        window, rolling_comp = None, None
+    return (
+        query, x, tuple(make_list(y)), z, tuple(make_list(group)), agg, window, rolling_comp, bool(allow_duplicates),
+        bool(downsample)
+    )
+
+
+def copy_chart_data(chart_data):
+    """
+    Copies the output of :meth:`dtale.charts.utils.build_chart` deep enough that callers can add keys to it or replace
+    the data of its series (EX: sorting bars) without altering the copy held in :attr:`dtale.charts.utils.CHART_CACHE`
+
+    :param chart_data: output of :meth:`dtale.charts.utils.build_chart`
+    :type chart_data: dict
+    :return: copy
+    :rtype: dict
+    """
+    chart_data = dict(chart_data)
+    for key in ['data', 'min', 'max', 'dtypes']:
+        if key in chart_data:
+            chart_data[key] = {k: dict(v) if isinstance(v, dict) else v for k, v in chart_data[key].items()}
+    return chart_data
+
+
 WEEKDAY_MAP = {idx: day for idx, day in enumerate(['Mon', 'Tues', 'Wed', 'Thur', 'Fri', 'Sat', 'Sun'])}
 
 
@@ -11,11 +11,13 @@ import plotly.graph_objs as go
 from six import PY3
 
 import dtale.dash_application.components as dash_components
-from dtale.charts.utils import YAXIS_CHARTS, ZAXIS_CHARTS, build_agg_data
+from dtale.charts.utils import (CHART_CACHE, YAXIS_CHARTS, ZAXIS_CHARTS,
+                                build_agg_data)
 from dtale.charts.utils import build_formatters as chart_formatters
-from dtale.charts.utils import (check_all_nan, check_exceptions,
-                                retrieve_chart_data, valid_chart,
-                                weekday_tick_handler)
+from dtale.charts.utils import (chart_cache_key, check_all_nan,
+                                check_exceptions, copy_chart_data,
+                                date_freq_memo, retrieve_chart_data,
+                                valid_chart, weekday_tick_handler)
 from dtale.dash_application.layout import (AGGS, build_error,
                                            update_label_for_freq)
 from dtale.utils import (classify_type, dict_merge, divide_chunks,
@@ -531,9 +533,12 @@ def line_builder(data, x, y, axes_builder, wrapper, cpg=False, **inputs):
         ]
         for series_key, series in data['data'].items()
     ])
+    title = build_title(x, y, agg=inputs.get('agg'))
+    if data.get('sampled'):
+        title['title']['text'] = '{} (sampled)'.format(title['title']['text'])
     return wrapper(dcc.Graph(
         id='line-graph',
-        figure={'data': data_cfgs, 'layout': build_layout(dict_merge(build_title(x, y, agg=inputs.get('agg')), axes))}
+        figure={'data': data_cfgs, 'layout': build_layout(dict_merge(title, axes))}
     ))
 
 
@@ -616,7 +621,7 @@ def heatmap_builder(data_id, **inputs):
         hm_kwargs = dict(hoverongaps=False, colorscale='Greens', showscale=True, hoverinfo='x+y+z')
         x, y, z, agg = (inputs.get(p) for p in ['x', 'y', 'z', 'agg'])
         y = y[0]
-        data = retrieve_chart_data(raw_data, x, y, z)
+        data = retrieve_chart_data(raw_data, x, y, z, freq_memo=date_freq_memo(data_id, raw_data))
         x_title = update_label_for_freq(x)
         y_title = update_label_for_freq(y)
         z_title = z
@@ -718,14 +723,24 @@ def build_figure_data(data_id, chart_type=None, query=None, x=None, y=None, z=No
         if not valid_chart(**dict(x=x, y=y, z=z, chart_type=chart_type)):
             return None
 
-        data = DATA[data_id] if (query or '') == '' else DATA[data_id].query(query)
+        query = (query or '').strip() or None
         chart_kwargs = dict(group_col=group, agg=agg, allow_duplicates=chart_type == 'scatter', rolling_win=window,
-                            rolling_comp=rolling_comp)
+                            rolling_comp=rolling_comp, freq_memo=date_freq_memo(data_id, DATA[data_id]),
+                            downsample=chart_type == 'line')
         if chart_type in ZAXIS_CHARTS:
             chart_kwargs['z'] = z
             del chart_kwargs['group_col']
-        data = build_chart_data(data, x, y, **chart_kwargs)
-        return data
+        cache_key = chart_cache_key(query, x, y, z=chart_kwargs.get('z'), group=chart_kwargs.get('group_col'),
+                                    agg=agg, window=window, rolling_comp=rolling_comp,
+                                    allow_duplicates=chart_kwargs['allow_duplicates'],
+                                    downsample=chart_kwargs['downsample'])
+
+        def _build():
+            data = DATA[data_id] if query is None else DATA[data_id].query(query)
+            return build_chart_data(data, x, y, **chart_kwargs)
+
+        # cosmetic changes (axis ranges, barmode, barsort...) re-render from the cached output of build_chart
+        return copy_chart_data(CHART_CACHE.get_or_build(data_id, cache_key, _build, data=DATA[data_id]))
     except BaseException as e:
         return dict(error=str(e), traceback=str(traceback.format_exc()))
 
@@ -0,0 +1,632 @@
+"""
+Vectorized statistics kernels used to summarize D-Tale data without making a separate pass over it for each
+statistic.
+"""
+from __future__ import division
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DESCRIBE_PERCENTILES = ['25%', '50%', '75%']
+
+
+def _zero_out_fperr(val):
+    # matches pandas.core.nanops._zero_out_fperr
+    return 0 if np.abs(val) < 1e-14 else val
+
+
+def numeric_describe(s, include_mode=True):
+    """
+    Builds the output of :meth:`pandas:pandas.Series.describe` along with 'sum', 'median', 'mode', 'var', 'sem',
+    'skew' & 'kurt' for a numeric series in a couple vectorized passes:
+     - one pass for the count & sum
+     - one pass over the centered values for the 2nd, 3rd & 4th moment sums which var, std, sem, skew & kurt are
+       derived from (using the same bias adjustments as :mod:`pandas:pandas.core.nanops`)
+     - one partition shared by the quartiles & median, plus min & max
+
+    Mode is still calculated using :meth:`pandas:pandas.Series.mode`.
+
+    :param s: integer or float series
+    :type s: :class:`pandas:pandas.Series`
+    :param include_mode: if false, 'mode' is left out of the output rather than counting every value
+    :type include_mode: bool, optional
+    :return: dictionary of statistic name/value pairs in the order :meth:`pandas:pandas.Series.describe` returns
+    :rtype: :class:`python:collections.OrderedDict`
+    """
+    values = s.values
+    is_int = values.dtype.kind in 'iu'
+    x = values.astype('float64')
+    mask = None if is_int else np.isnan(x)
+    if mask is not None and mask.any():
+        valid = x[~mask]
+        x = np.where(mask, 0, x)
+    else:
+        mask = None
+        valid = x
+    count = len(valid)
+
+    total = x.sum()
+    mean = total / count if count else np.nan
+    m2 = m3 = m4 = np.nan
+    if count:
+        with np.errstate(invalid='ignore'):  # infinite values
+            adjusted = x - mean
+            if mask is not None:
+                adjusted[mask] = 0
+            adjusted2 = adjusted ** 2
+            m2 = adjusted2.sum()
+            m3 = (adjusted2 * adjusted).sum()
+            m4 = (adjusted2 ** 2).sum()
+
+    var = m2 / (count - 1) if count > 1 else np.nan
+    std = np.sqrt(var)
+    sem = std / np.sqrt(count) if count > 1 else np.nan
+
+    skew = np.nan
+    if count >= 3:
+        skew_m2, skew_m3 = _zero_out_fperr(m2), _zero_out_fperr(m3)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            skew = 0.0 if skew_m2 == 0 else (count * (count - 1) ** 0.5 / (count - 2)) * (skew_m3 / skew_m2 ** 1.5)
+
+    kurt = np.nan
+    if count >= 4:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+            numerator = _zero_out_fperr(count * (count + 1) * (count - 1) * m4)
+            denominator = _zero_out_fperr((count - 2) * (count - 3) * m2 ** 2)
+            kurt = 0.0 if denominator == 0 else numerator / denominator - adj
+
+    if count:
+        with np.errstate(invalid='ignore'):
+            quartiles = np.percentile(valid, [25, 50, 75])
+        min_val, max_val = valid.min(), valid.max()
+    else:
+        quartiles = [np.nan] * 3
+        min_val = max_val = np.nan
+
+    stats = OrderedDict([('count', float(count)), ('mean', mean), ('std', std), ('min', min_val)])
+    stats.update(zip(DESCRIBE_PERCENTILES, quartiles))
+    stats['max'] = max_val
+    stats['sum'] = values.sum() if is_int else total
+    # linear interpolation between infinite values gives NaN where numpy's median (like pandas) gives +/-inf
+    stats['median'] = np.median(valid) if count and np.isnan(quartiles[1]) else quartiles[1]
+    if include_mode:
+        mode = s.mode().values
+        stats['mode'] = np.nan if len(mode) != 1 else mode[0]
+    stats['var'] = var
+    stats['sem'] = sem
+    stats['skew'] = skew
+    stats['kurt'] = kurt
+    return stats
+
+
+def numeric_describe_df(s, additional_aggs=None):
+    """
+    Wraps the output of :meth:`dtale.stats.numeric_describe` in a single-row dataframe equivalent to
+    `s.describe().to_frame().T` with a column appended for each additional aggregation
+
+    :param s: integer or float series
+    :type s: :class:`pandas:pandas.Series`
+    :param additional_aggs: additional aggregations to include ('sum', 'median', 'mode', 'var', 'sem', 'skew', 'kurt')
+    :type additional_aggs: list of str, optional
+    :return: dataframe
+    :rtype: :class:`pandas:pandas.DataFrame`
+    """
+    stats = numeric_describe(s, include_mode='mode' in (additional_aggs or []))
+    cols = ['count', 'mean', 'std', 'min'] + DESCRIBE_PERCENTILES + ['max'] + list(additional_aggs or [])
+    desc = pd.DataFrame([[stats[c] for c in cols[:8]]], columns=cols[:8], index=[s.name], dtype='float64')
+    for agg in cols[8:]:
+        desc[agg] = stats[agg]
+    return desc
+
+
+def hash_values(values):
+    """
+    64-bit hashes of an array of values, used by the sketches below so that values (strings especially) only need to
+    be hashed once
+
+    :param values: array of values
+    :type values: :class:`numpy:numpy.ndarray`
+    :return: hashes
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    return pd.util.hash_array(values, categorize=False)
+
+
+def hll_registers(hashes, p=14):
+    """
+    Builds HyperLogLog registers from value hashes.  Registers from different chunks of data can be combined using
+    :func:`numpy:numpy.maximum`.
+
+    :param hashes: output of :meth:`dtale.stats.hash_values`
+    :type hashes: :class:`numpy:numpy.ndarray`
+    :param p: precision, 2 ** p registers will be used (relative error ~1.04 / sqrt(2 ** p))
+    :type p: int
+    :return: register values
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    idx = (hashes >> np.uint64(64 - p)).astype('int64')
+    rest = (hashes & np.uint64((1 << (64 - p)) - 1)).astype('float64')
+    with np.errstate(divide='ignore'):
+        bit_length = np.maximum(np.floor(np.log2(rest)) + 1, 0)
+    rho = (64 - p + 1 - bit_length).astype('uint8')
+    # assigning registers in ascending order of rho leaves each register holding its maximum
+    order = np.argsort(rho, kind='stable')
+    registers = np.zeros(1 << p, dtype='uint8')
+    registers[idx[order]] = rho[order]
+    return registers
+
+
+def hll_estimate(registers):
+    """
+    Estimates the number of distinct values from HyperLogLog registers built by :meth:`dtale.stats.hll_registers`
+
+    :param registers: register values
+    :type registers: :class:`numpy:numpy.ndarray`
+    :return: estimated distinct count
+    :rtype: int
+    """
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m ** 2 / np.sum(np.power(2.0, -registers.astype('float64')))
+    zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)  # small range correction
+    return int(round(estimate))
+
+
+def _merge_counts(summary, counts, capacity):
+    """
+    Adds the counts of a chunk to a heavy-hitters summary and truncates the result to the `capacity` largest counts
+
+    :return: tuple of (summary, maximum underestimation introduced by truncating)
+    :rtype: tuple
+    """
+    def _truncate(counts):
+        if len(counts) <= capacity:
+            return counts, 0
+        counts = counts.nlargest(capacity + 1)
+        return counts.iloc[:capacity], int(counts.iloc[-1])
+
+    counts, chunk_error = _truncate(counts)
+    summary, merge_error = _truncate(counts if not len(summary) else summary.add(counts, fill_value=0))
+    return summary, chunk_error + merge_error
+
+
+def approx_value_counts(s, capacity=1000, chunk_size=1000000):
+    """
+    Mergeable heavy-hitters summary of a series.  Each chunk of the data is counted exactly and merged into a
+    summary which only retains the `capacity` most frequent values, so memory is bounded by the chunk size and
+    capacity rather than the cardinality of the whole series.  Counts of retained values may be underestimated by
+    at most the returned error.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :param capacity: maximum number of values retained in the summary
+    :type capacity: int
+    :param chunk_size: number of rows counted at a time
+    :type chunk_size: int
+    :return: tuple of (counts sorted descending, maximum underestimation of any count)
+    :rtype: tuple
+    """
+    summary = pd.Series([], dtype='int64')
+    error = 0
+    for start in range(0, len(s), chunk_size):
+        summary, chunk_error = _merge_counts(
+            summary, s.iloc[start:start + chunk_size].value_counts(sort=False), capacity
+        )
+        error += chunk_error
+    return summary.astype('int64').sort_values(ascending=False, kind='mergesort'), error
+
+
+def approx_uniques(s, top=100, p=14, chunk_size=1000000, sample_size=10000):
+    """
+    Approximate distinct count & most common values of a series, processed in chunks so memory is bounded by the
+    chunk size rather than the length of the series.  Each chunk updates HyperLogLog registers and a heavy-hitters
+    summary (see :meth:`dtale.stats.approx_value_counts`).  If the summary managed to hold every distinct value then
+    both results are exact.
+
+    Chunks are normally counted by value and only their distinct values are hashed.  Counting python objects is
+    slow when most of them are distinct though, so when a sample of an object series looks high-cardinality each
+    chunk is hashed first, the hashes are counted instead and one representative value is kept per hash retained by
+    the summary.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :param top: number of most common values to return
+    :type top: int
+    :param p: HyperLogLog precision
+    :type p: int
+    :param chunk_size: number of rows processed at a time
+    :type chunk_size: int
+    :param sample_size: number of values sampled from object series to decide whether to count hashes
+    :type sample_size: int
+    :return: tuple of (distinct count, counts of most common values, exact flag)
+    :rtype: tuple
+    """
+    hash_first = False
+    if s.dtype == object and len(s):
+        sample = s.values[np.random.RandomState(0).randint(0, len(s), min(len(s), sample_size))]
+        hash_first = len(pd.unique(sample)) > len(sample) * 0.1
+
+    registers = np.zeros(1 << p, dtype='uint8')
+    summary = pd.Series([], dtype='int64')
+    representatives = pd.Series([], dtype=object)
+    error = 0
+    for start in range(0, len(s), chunk_size):
+        chunk = s.iloc[start:start + chunk_size]
+        if hash_first:
+            values = chunk.dropna().values
+            hashes = hash_values(values)
+            counts = pd.Series(hashes).value_counts(sort=False)
+        else:
+            counts = chunk.value_counts(sort=False)
+            hashes = hash_values(np.asarray(counts.index))
+        if not len(counts):
+            continue
+        registers = np.maximum(registers, hll_registers(hashes, p=p))
+        summary, chunk_error = _merge_counts(summary, counts, max(top * 10, 1000))
+        error += chunk_error
+
+        if hash_first:
+            representatives = representatives[representatives.index.isin(summary.index)]
+            missing = pd.Index(summary.index[~summary.index.isin(representatives.index)])
+            if len(missing):  # first value in this chunk for each hash which entered the summary
+                positions = np.flatnonzero(missing.get_indexer(hashes) >= 0)
+                firsts = pd.Series(positions, index=hashes[positions])
+                firsts = firsts[~firsts.index.duplicated()]
+                representatives = pd.concat([representatives, pd.Series(values[firsts.values], index=firsts.index)])
+
+    counts = summary.astype('int64').sort_values(ascending=False, kind='mergesort').head(top)
+    if hash_first:
+        counts = pd.Series(counts.values, index=pd.Index(representatives.reindex(counts.index).tolist()))
+    if not error:
+        return len(summary), counts, True
+    return hll_estimate(registers), counts, False
+
+
+def merge_histogram(counts, edges, bins):
+    """
+    Derives a coarser histogram from a finer one (like the output of :func:`numpy:numpy.histogram`) by summing
+    adjacent bins.  This is only possible when `bins` divides the number of fine bins and the edges
+    :func:`numpy:numpy.histogram` would produce for `bins` bins coincide exactly with fine edges, otherwise values
+    sitting on a bin edge could be counted in a different bin.
+
+    :param counts: counts of the fine histogram
+    :type counts: :class:`numpy:numpy.ndarray`
+    :param edges: bin edges of the fine histogram
+    :type edges: :class:`numpy:numpy.ndarray`
+    :param bins: number of bins
+    :type bins: int
+    :return: tuple of (counts, edges) or `None` if they can't be derived from the fine histogram
+    :rtype: tuple
+    """
+    if bins < 1 or len(counts) % bins:
+        return None
+    step = len(counts) // bins
+    coarse_edges = np.linspace(edges[0], edges[-1], bins + 1, dtype=edges.dtype)
+    if not np.array_equal(edges[::step], coarse_edges):
+        return None
+    return counts.reshape(bins, step).sum(axis=1), coarse_edges
+
+
+def _valid_blocks(values, chunk_size):
+    for start in range(0, len(values), chunk_size):
+        block = values[start:start + chunk_size]
+        if block.dtype.kind == 'f':
+            block = block[~np.isnan(block)]
+        if len(block):
+            yield block
+
+
+def chunked_histogram(values, bins, chunk_size=1000000):
+    """
+    Equivalent of :func:`numpy:numpy.histogram` (with NaNs dropped) which walks contiguous blocks of an array rather
+    than requiring a NaN-free copy of it.  See :func:`dtale.stats.chunked_histograms`.
+
+    :param values: integer or float array
+    :type values: :class:`numpy:numpy.ndarray`
+    :param bins: number of bins
+    :type bins: int
+    :param chunk_size: number of values processed at a time
+    :type chunk_size: int
+    :return: tuple of (counts, edges)
+    :rtype: tuple
+    """
+    return chunked_histograms(values, [bins], chunk_size=chunk_size)[0]
+
+
+def chunked_histograms(values, bins, chunk_size=1000000):
+    """
+    Builds the equivalent of :func:`numpy:numpy.histogram` (with NaNs dropped) for several bin counts at once while
+    walking contiguous blocks of an array rather than requiring a NaN-free copy of it.  A first pass finds the min &
+    max of each block to fix the bin edges and a second accumulates each block's counts for every bin count into
+    them, so extra memory is bounded by the chunk size.
+
+    :param values: integer or float array
+    :type values: :class:`numpy:numpy.ndarray`
+    :param bins: list of bin counts
+    :type bins: list of int
+    :param chunk_size: number of values processed at a time
+    :type chunk_size: int
+    :return: list of (counts, edges) tuples in the same order as `bins`
+    :rtype: list
+    """
+    first = last = None
+    for block in _valid_blocks(values, chunk_size):
+        block_min, block_max = block.min(), block.max()
+        first = block_min if first is None else min(first, block_min)
+        last = block_max if last is None else max(last, block_max)
+    if first is None:
+        return [np.histogram(values[:0], bins=b) for b in bins]
+    if not (np.isfinite(first) and np.isfinite(last)):
+        raise ValueError('autodetected range of [{}, {}] is not finite'.format(first, last))
+
+    hists = [(None, None) for _ in bins]
+    for block in _valid_blocks(values, chunk_size):
+        for i, b in enumerate(bins):
+            block_counts, edges = np.histogram(block, bins=b, range=(first, last))
+            counts = hists[i][0]
+            hists[i] = (block_counts if counts is None else counts + block_counts, edges)
+    return hists
+
+
+def _bin_values(block, lo, hi, closed):
+    # same membership numpy.histogram uses: [lo, hi) for every bin but the last one which is [lo, hi]
+    return block[(block >= lo) & ((block <= hi) if closed else (block < hi))]
+
+
+def _select_ranks(values, ranks, counts, edges, chunk_size):
+    """
+    Finds the values at the given (sorted) positions of the sorted non-null values of an array using a histogram of
+    it.  Only the values of the bins holding those positions are gathered and when a bin holds more than
+    `chunk_size` values it is narrowed down to the range of its values and histogrammed again, so extra memory is
+    bounded by the chunk size.
+
+    :return: dictionary of position/value pairs
+    :rtype: dict
+    """
+    found = {}
+    ends = np.cumsum(counts)
+    bin_ids = np.searchsorted(ends, ranks, side='right')
+    for bin_id in sorted(set(bin_ids)):
+        below = ends[bin_id] - counts[bin_id]
+        offsets = [rank - below for rank, rank_bin in zip(ranks, bin_ids) if rank_bin == bin_id]
+        lo, hi, closed = edges[bin_id], edges[bin_id + 1], bin_id == len(counts) - 1
+        gathered, first, last = [], None, None
+        for block in _valid_blocks(values, chunk_size):
+            block = _bin_values(block, lo, hi, closed)
+            if not len(block):
+                continue
+            first = block.min() if first is None else min(first, block.min())
+            last = block.max() if last is None else max(last, block.max())
+            if counts[bin_id] <= chunk_size:
+                gathered.append(block)
+        if first == last:
+            bin_found = {offset: first for offset in offsets}
+        elif counts[bin_id] <= chunk_size:
+            gathered = np.concatenate(gathered)
+            gathered.partition(offsets)
+            bin_found = dict(zip(offsets, gathered[offsets]))
+        else:
+            # the min & max of the bin land in different sub-bins so each pass strictly shrinks the candidates
+            sub_counts = np.zeros(len(counts), dtype='int64')
+            for block in _valid_blocks(values, chunk_size):
+                block_counts, sub_edges = np.histogram(
+                    _bin_values(block, lo, hi, closed), bins=len(counts), range=(first, last)
+                )
+                sub_counts += block_counts
+            bin_found = _select_ranks(values, offsets, sub_counts, sub_edges, chunk_size)
+        found.update((below + offset, value) for offset, value in bin_found.items())
+    return found
+
+
+def chunked_describe(values, counts, edges, chunk_size=1000000):
+    """
+    Builds the output of :meth:`pandas:pandas.Series.describe` for an integer or float array from its histogram (the
+    output of :func:`dtale.stats.chunked_histograms`) while walking contiguous blocks of it rather than copying it:
+     - count comes straight from the histogram
+     - one pass for the sum, min & max and one for the squared deviations from the mean
+     - quartiles only gather the values of the bins they land in (see :func:`dtale.stats._select_ranks`)
+
+    :param values: integer or float array
+    :type values: :class:`numpy:numpy.ndarray`
+    :param counts: histogram counts of `values`
+    :type counts: :class:`numpy:numpy.ndarray`
+    :param edges: histogram bin edges of `values`
+    :type edges: :class:`numpy:numpy.ndarray`
+    :param chunk_size: number of values processed at a time
+    :type chunk_size: int
+    :return: dictionary of statistic name/value pairs in the order :meth:`pandas:pandas.Series.describe` returns
+    :rtype: :class:`python:collections.OrderedDict`
+    """
+    count = int(counts.sum())
+    stats = OrderedDict([('count', float(count)), ('mean', np.nan), ('std', np.nan), ('min', np.nan)])
+    stats.update((p, np.nan) for p in DESCRIBE_PERCENTILES)
+    stats['max'] = np.nan
+    if not count:
+        return stats
+
+    total, first, last = 0.0, None, None
+    for block in _valid_blocks(values, chunk_size):
+        total += block.sum(dtype='float64')
+        first = block.min() if first is None else min(first, block.min())
+        last = block.max() if last is None else max(last, block.max())
+    mean = total / count
+    if count > 1:
+        m2 = sum(((block.astype('float64') - mean) ** 2).sum() for block in _valid_blocks(values, chunk_size))
+        stats['std'] = np.sqrt(m2 / (count - 1))
+    stats['mean'] = mean
+    stats['min'], stats['max'] = float(first), float(last)
+
+    positions = [q * (count - 1) for q in (0.25, 0.5, 0.75)]
+    ranks = sorted(set(int(np.floor(pos)) for pos in positions) | set(int(np.ceil(pos)) for pos in positions))
+    found = _select_ranks(values, ranks, counts, edges, chunk_size)
+    for p, pos in zip(DESCRIBE_PERCENTILES, positions):
+        lower, upper = float(found[int(np.floor(pos))]), float(found[int(np.ceil(pos))])
+        stats[p] = lower + (upper - lower) * (pos - np.floor(pos))
+    return stats
+
+
+def pairwise_pearson(values):
+    """
+    NaN-aware Pearson correlation matrix equivalent to :meth:`pandas:pandas.DataFrame.corr` (each pair of columns
+    only uses rows where both are finite) computed with a handful of matrix multiplications rather than a loop over
+    every pair of columns.  With X holding the zero-filled values and M flagging non-null values, the pairwise
+    counts, sums, sums of squares & cross-products are M'M, X'M, (X*X)'M & X'X.
+
+    Columns are centered beforehand to limit cancellation error, pairs whose variance is effectively zero return NaN
+    (like pandas) and results are clipped to [-1, 1].
+
+    :param values: 2-D array of floats (rows x columns)
+    :type values: :class:`numpy:numpy.ndarray`
+    :return: correlation matrix (columns x columns)
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    values = np.asarray(values, dtype='float64')
+    valid = np.isfinite(values)
+    mask = valid.astype('float64')
+    counts = mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(valid, values, 0).sum(axis=0) / counts
+    centered = np.where(valid, values - np.where(np.isnan(means), 0, means), 0)
+    constant = np.nanmax(np.where(valid, values, -np.inf), axis=0) == np.nanmin(np.where(valid, values, np.inf), axis=0)
+    centered[:, constant] = 0
+
+    n = mask.T.dot(mask)
+    sums = centered.T.dot(mask)  # sums[i, j]: sum of column i over rows where i & j are non-null
+    sum_squares = (centered ** 2).T.dot(mask)
+    cross = centered.T.dot(centered)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = cross - sums * sums.T / n
+        var_x = sum_squares - sums ** 2 / n
+        var_y = var_x.T
+        # variances which are tiny relative to the sums of squares they came from are rounding error
+        var_x = np.where(var_x <= 1e-14 * sum_squares, 0, var_x)
+        var_y = np.where(var_y <= 1e-14 * sum_squares.T, 0, var_y)
+        divisor = np.sqrt(var_x * var_y)
+        corr = np.where((divisor > 0) & (n > 0), cov / divisor, np.nan)
+    return np.clip(corr, -1, 1)
+
+
+def grouped_pearson(codes, x, y, ngroups):
+    """
+    Pearson correlation of two arrays within each group, equivalent to calling :meth:`pandas:pandas.DataFrame.corr`
+    on each group (pairs with a null value are dropped).  Groups are described by integer codes (EX: the output of
+    :func:`pandas:pandas.factorize`) so per-group sums can be gathered with :func:`numpy:numpy.bincount`: one pass
+    for counts & means and a second for the centered sums of squares & cross-products.
+
+    :param codes: group code of each row, rows with negative codes are ignored
+    :type codes: :class:`numpy:numpy.ndarray`
+    :param x: values of the first column
+    :type x: :class:`numpy:numpy.ndarray`
+    :param y: values of the second column
+    :type y: :class:`numpy:numpy.ndarray`
+    :param ngroups: number of groups
+    :type ngroups: int
+    :return: correlation of each group (NaN for groups without variance or values)
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    valid = (codes >= 0) & ~np.isnan(x) & ~np.isnan(y)
+    codes, x, y = codes[valid], x[valid], y[valid]
+    n = np.bincount(codes, minlength=ngroups).astype('float64')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dx = x - (np.bincount(codes, weights=x, minlength=ngroups) / n)[codes]
+        dy = y - (np.bincount(codes, weights=y, minlength=ngroups) / n)[codes]
+        sxx = np.bincount(codes, weights=dx * dx, minlength=ngroups)
+        syy = np.bincount(codes, weights=dy * dy, minlength=ngroups)
+        sxy = np.bincount(codes, weights=dx * dy, minlength=ngroups)
+        # sums of squares which are tiny relative to the squared values are rounding error from constant groups
+        sxx = np.where(sxx <= 1e-14 * np.bincount(codes, weights=x * x, minlength=ngroups), 0, sxx)
+        syy = np.where(syy <= 1e-14 * np.bincount(codes, weights=y * y, minlength=ngroups), 0, syy)
+        divisor = np.sqrt(sxx * syy)
+        corr = np.where(divisor > 0, sxy / divisor, np.nan)
+    return np.clip(corr, -1, 1)
+
+
+def thin_scatter(x, y, max_points, bins=100, seed=0):
+    """
+    Selects a subset of at most `max_points` points of a scatter which preserves its shape.  Points are binned into a
+    `bins` x `bins` grid and each cell keeps at most the same number of randomly chosen points, with that cap set as
+    high as `max_points` allows.  Dense areas are thinned out while sparse cells (outliers) are kept in full.
+
+    :param x: x-axis values, must not contain NaN
+    :type x: :class:`numpy:numpy.ndarray`
+    :param y: y-axis values, must not contain NaN
+    :type y: :class:`numpy:numpy.ndarray`
+    :param max_points: maximum number of points to keep
+    :type max_points: int
+    :param bins: number of grid cells along each axis
+    :type bins: int, optional
+    :param seed: seed of the random choice of points within each cell so repeated calls return the same subset
+    :type seed: int, optional
+    :return: sorted positions of the points kept
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    total = len(x)
+    if total <= max_points:
+        return np.arange(total)
+
+    def _cells(values):
+        values = np.asarray(values, dtype='float64')
+        finite = values[np.isfinite(values)]
+        if not len(finite) or finite.min() == finite.max():
+            return np.zeros(total, dtype='int64')
+        lo, hi = finite.min(), finite.max()
+        cells = np.floor((np.clip(values, lo, hi) - lo) / (hi - lo) * bins).astype('int64')
+        return np.minimum(cells, bins - 1)
+
+    cells = _cells(x) * bins + _cells(y)
+    counts = np.bincount(cells, minlength=bins * bins)
+
+    # largest per-cell cap for which sum(min(counts, cap)) still fits within max_points
+    sorted_counts = np.sort(counts[counts > 0])
+    cumulative = np.concatenate([[0], np.cumsum(sorted_counts)])
+    low, high = 0, int(sorted_counts[-1])
+    while low < high:
+        cap = (low + high + 1) // 2
+        idx = np.searchsorted(sorted_counts, cap)
+        if cumulative[idx] + cap * (len(sorted_counts) - idx) <= max_points:
+            low = cap
+        else:
+            high = cap - 1
+    cap = max(low, 1)
+
+    random_state = np.random.RandomState(seed)
+    order = np.lexsort((random_state.random_sample(total), cells))
+    cell_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    ranks = np.arange(total) - cell_starts[cells[order]]
+    kept = order[ranks < cap]
+    if len(kept) > max_points:  # more occupied cells than max_points
+        kept = random_state.choice(kept, max_points, replace=False)
+    return np.sort(kept)
+
+
+def masked_ranks(values, order, mask=None):
+    """
+    Average ranks (ties share the mean of their ranks, like :meth:`pandas:pandas.Series.rank`) of a subset of values
+    using a precomputed sort order of all the values, so ranking any subset is a linear pass rather than a sort.
+
+    :param values: all values
+    :type values: :class:`numpy:numpy.ndarray`
+    :param order: positions which sort `values`, for example from :func:`numpy:numpy.argsort`
+    :type order: :class:`numpy:numpy.ndarray`
+    :param mask: boolean mask of the values to rank, all values are ranked when `None`
+    :type mask: :class:`numpy:numpy.ndarray`, optional
+    :return: 1-based ranks of the masked values at their positions in `values`, NaN everywhere else
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    if mask is not None:
+        order = order[mask[order]]
+    ranks = np.full(len(values), np.nan)
+    if not len(order):
+        return ranks
+    sorted_values = values[order]
+    boundaries = np.flatnonzero(np.concatenate([[True], sorted_values[1:] != sorted_values[:-1], [True]]))
+    starts, ends = boundaries[:-1], boundaries[1:]
+    ranks[order] = np.repeat((starts + ends + 1) / 2.0, ends - starts)
+    return ranks
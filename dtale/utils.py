@@ -3,6 +3,7 @@ from __future__ import division
 import decimal
 import json
 import os
+import re
 import socket
 import sys
 import time
@@ -15,8 +16,16 @@ import numpy as np
 import pandas as pd
 from past.utils import old_div
 
+from dtale.cache import DataCache
+
 logger = getLogger(__name__)
 
+# 'YYYY-MM-DD' representations of datetime columns per (data_id, column) for substring filters, bounded to ~512MB
+DATE_STRINGS_CACHE = DataCache('date_strings', max_bytes=512 * 1024 ** 2)
+DATE_PREFIX = re.compile(r'^\d{4}(-\d{2}(-\d{2})?)?$')
+# dictionary encodings of low-cardinality string columns per (data_id, column), bounded to ~512MB
+STRING_CODES_CACHE = DataCache('string_codes', max_bytes=512 * 1024 ** 2)
+
 
 def running_with_pytest():
     """
@@ -272,6 +281,121 @@ def json_date(x, fmt='%Y-%m-%d %H:%M:%S', nan_display='', **kwargs):
         return nan_display
 
 
+def _numpy_values(values):
+    """
+    Returns the :class:`numpy:numpy.ndarray` backing a column of values or `None` if it is not backed by one (lists,
+    pandas extension arrays...)
+    """
+    if isinstance(values, pd.Series):
+        values = values.values
+    return values if isinstance(values, np.ndarray) else None
+
+
+def json_strings(values, nan_display='', **kwargs):
+    """
+    Vectorized version of :meth:`dtale.utils.json_string` which converts an entire column of values in one pass
+
+    :param values: column of values to be converted to strings
+    :type values: :class:`pandas:pandas.Series` or :class:`numpy:numpy.ndarray`
+    :param nan_display: value to be used for any falsy values
+    :return: list of string values
+    :rtype: list
+    """
+    arr = _numpy_values(values)
+    if arr is not None and arr.dtype.kind == 'O':
+        try:
+            truthy = arr.astype(bool)
+            output = np.array(list(map(str, arr)), dtype=object)
+            output[~truthy] = nan_display
+            return output.tolist()
+        except BaseException:
+            pass
+    return [json_string(v, nan_display=nan_display) for v in values]
+
+
+def json_ints(values, nan_display='', as_string=False, fmt='{:,d}'):
+    """
+    Vectorized version of :meth:`dtale.utils.json_int` which converts an entire column of values in one pass
+
+    :param values: column of values to be converted to integers
+    :type values: :class:`pandas:pandas.Series` or :class:`numpy:numpy.ndarray`
+    :param nan_display: if a value is :attr:`numpy:numpy.nan` then use this value
+    :param as_string: return integers as formatted strings (EX: 1,000,000)
+    :return: list of integer values
+    :rtype: list
+    """
+    arr = _numpy_values(values)
+    output = None
+    if arr is not None and arr.dtype.kind in 'iub':
+        output = arr.astype('int64').tolist() if arr.dtype.kind == 'b' else arr.tolist()
+        valid = None
+    elif arr is not None and arr.dtype.kind == 'f':
+        valid = np.isfinite(arr)
+        if not valid.any() or np.abs(arr[valid]).max() < 2 ** 63:
+            output = np.empty(len(arr), dtype=object)
+            output[valid] = arr[valid].astype('int64').tolist()
+    if output is None:
+        return [json_int(v, nan_display=nan_display, as_string=as_string, fmt=fmt) for v in values]
+    if as_string:
+        output = [fmt.format(v) for v in output] if valid is None else [
+            fmt.format(v) if is_valid else None for v, is_valid in zip(output, valid)
+        ]
+    if valid is not None:
+        output = np.array(output, dtype=object)
+        output[~valid] = nan_display
+        output = output.tolist()
+    return output
+
+
+def json_floats(values, precision=2, nan_display='nan', inf_display='inf', as_string=False):
+    """
+    Vectorized version of :meth:`dtale.utils.json_float` which rounds an entire column of values in one pass
+
+    :param values: column of values to be converted to floats
+    :type values: :class:`pandas:pandas.Series` or :class:`numpy:numpy.ndarray`
+    :param precision: precision of floats to be returned
+    :param nan_display: if a value is :attr:`numpy:numpy.nan` then use this value
+    :param inf_display: if a value is :attr:`numpy:numpy.inf` then use this value
+    :param as_string: return floats as formatted strings (EX: 1,234.5643)
+    :return: list of float values
+    :rtype: list
+    """
+    arr = _numpy_values(values)
+    if as_string or arr is None or arr.dtype.kind not in 'iufb':
+        return [
+            json_float(v, precision, nan_display=nan_display, inf_display=inf_display, as_string=as_string)
+            for v in values
+        ]
+    arr = arr.astype('float64')
+    output = np.round(arr, precision).astype(object)
+    output[np.isnan(arr)] = nan_display
+    output[np.isinf(arr)] = inf_display
+    return output.tolist()
+
+
+def json_dates(values, fmt='%Y-%m-%d %H:%M:%S', nan_display='', **kwargs):
+    """
+    Vectorized version of :meth:`dtale.utils.json_date` which uses :meth:`pandas:pandas.Series.dt.strftime` to
+    convert an entire column of values in one pass
+
+    :param values: column of values to be converted to date strings
+    :type values: :class:`pandas:pandas.Series` or :class:`numpy:numpy.ndarray`
+    :param fmt: the data string formatting to be applied
+    :param nan_display: if a value is :attr:`numpy:numpy.nan` then use this value
+    :return: list of date strings
+    :rtype: list
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        return [json_date(v, fmt=fmt, nan_display=nan_display) for v in values]
+    output = series.dt.strftime(fmt)
+    empty_time = ' 00:00:00'
+    output = output.mask(output.str.endswith(empty_time, na=False), output.str[:-1 * len(empty_time)])
+    output = output.values.astype(object)
+    output[pd.isnull(output)] = nan_display
+    return output.tolist()
+
+
 def json_timestamp(x, nan_display='', **kwargs):
     """
     Convert value to timestamp (milliseconds) to be used within JSON output
@@ -305,20 +429,30 @@ class JSONFormatter(object):
 
     def __init__(self, nan_display=''):
         self.fmts = []
+        self.vec_fmts = {}
         self.nan_display = nan_display
 
     def add_string(self, idx, name=None):
         self.fmts.append([idx, name, json_string])
+        self.vec_fmts[idx] = json_strings
 
     def add_int(self, idx, name=None, as_string=False):
         def f(x, nan_display):
             return json_int(x, nan_display=nan_display, as_string=as_string)
+
+        def vec_f(values, nan_display):
+            return json_ints(values, nan_display=nan_display, as_string=as_string)
         self.fmts.append([idx, name, f])
+        self.vec_fmts[idx] = vec_f
 
     def add_float(self, idx, name=None, precision=6, as_string=False):
         def f(x, nan_display):
             return json_float(x, precision, nan_display=nan_display, as_string=as_string)
+
+        def vec_f(values, nan_display):
+            return json_floats(values, precision, nan_display=nan_display, as_string=as_string)
         self.fmts.append([idx, name, f])
+        self.vec_fmts[idx] = vec_f
 
     def add_timestamp(self, idx, name=None):
         self.fmts.append([idx, name, json_timestamp])
@@ -326,7 +460,11 @@ class JSONFormatter(object):
     def add_date(self, idx, name=None, fmt='%Y-%m-%d %H:%M:%S'):
         def f(x, nan_display):
             return json_date(x, fmt=fmt, nan_display=nan_display)
+
+        def vec_f(values, nan_display):
+            return json_dates(values, fmt=fmt, nan_display=nan_display)
         self.fmts.append([idx, name, f])
+        self.vec_fmts[idx] = vec_f
 
     def add_json(self, idx, name=None):
         def f(x, nan_display):
@@ -341,12 +479,62 @@ class JSONFormatter(object):
     def format_dicts(self, lsts):
         return [self.format_dict(l) for l in lsts]
 
+    def format_column(self, idx, values):
+        """
+        Formats an entire column of values in one pass using the vectorized formatter registered for `idx`, falling
+        back to calling the scalar formatter on each value when there isn't one
+
+        :param idx: index of the formatter
+        :param values: column of values
+        :type values: :class:`pandas:pandas.Series`
+        :return: list of formatted values
+        :rtype: list
+        """
+        vec_f = self.vec_fmts.get(idx)
+        if vec_f is not None:
+            return vec_f(values, nan_display=self.nan_display)
+        f = next(f for fmt_idx, _name, f in self.fmts if fmt_idx == idx)
+        return [f(v, nan_display=self.nan_display) for v in values]
+
+    def format_df_dicts(self, df):
+        """
+        Column-at-a-time replacement for calling :meth:`dtale.utils.JSONFormatter.format_dicts` on the output of
+        :meth:`pandas:pandas.DataFrame.itertuples`.  Each column is formatted using vectorized operations and the rows
+        are assembled once at the end.
+
+        :param df: dataframe
+        :type df: :class:`pandas:pandas.DataFrame`
+        :return: list of dictionaries
+        :rtype: list
+        """
+        cols = self.format_df_columns(df)
+        if not len(cols):
+            return [{} for _ in range(len(df))]
+        names = list(cols.keys())
+        return [dict(zip(names, row)) for row in zip(*[cols[name] for name in names])]
+
+    def format_df_columns(self, df):
+        """
+        Columnar version of :meth:`dtale.utils.JSONFormatter.format_df_dicts` which returns a list of formatted values
+        per column so that column names are only included once rather than once per row
+
+        :param df: dataframe
+        :type df: :class:`pandas:pandas.DataFrame`
+        :return: dictionary of column name/list of values pairs
+        :rtype: dict
+        """
+        return {name: self.format_column(idx, df[name]) for idx, name, _f in self.fmts if name in df.columns}
+
     def format_lists(self, df):
-        return {
-            name: [f(v, nan_display=self.nan_display) for v in df[name].values]
-            for _idx, name, f in self.fmts
-            if name in df.columns
-        }
+        """
+        Alias of :meth:`dtale.utils.JSONFormatter.format_df_columns`
+
+        :param df: dataframe
+        :type df: :class:`pandas:pandas.DataFrame`
+        :return: dictionary of column name/list of values pairs
+        :rtype: dict
+        """
+        return self.format_df_columns(df)
 
     def format_df(self, df):
         formatters = {col: f for _idx, col, f in self.fmts}
@@ -439,13 +627,30 @@ def sort_df_for_grid(df, params):
     :return: sorted dataframe
     :rtype: :class:`pandas:pandas.DataFrame`
     """
-    if 'sort' in params:
-        cols, dirs = [], []
-        for col, dir in params['sort']:
-            cols.append(col)
-            dirs.append(dir == 'ASC')
-        return df.sort_values(cols, ascending=dirs)
-    return df.sort_index()
+    positions = sort_positions_for_grid(df, params)
+    return df.sort_index() if positions is None else df.iloc[positions]
+
+
+def sort_positions_for_grid(df, params):
+    """
+    Returns the permutation of row positions that would sort the dataframe (see
+    :meth:`dtale.utils.sort_df_for_grid` for the structure of the 'sort' property) rather than a sorted copy of it,
+    so the original dataframe is left untouched and only the columns being sorted on are copied.
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param params: arguments from :attr:`flask:flask.request`
+    :type params: dict
+    :return: row positions in sorted order or `None` if there is no 'sort' property (natural order)
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    if 'sort' not in params:
+        return None
+    cols, dirs = [], []
+    for col, dir in params['sort']:
+        cols.append(col)
+        dirs.append(dir == 'ASC')
+    return df[cols].reset_index(drop=True).sort_values(cols, ascending=dirs).index.values
 
 
 def filter_df_for_grid(df, params):
@@ -506,6 +711,114 @@ def filter_df_for_grid(df, params):
     :return: filtering dataframe
     :rtype: :class:`pandas:pandas.DataFrame`
     """
+    mask = build_filter_mask(df, params)
+    if mask is not None:
+        df = df[mask]
+    if params.get('query'):
+        df = df.query(params['query'])
+    return df
+
+
+def date_filter_mask(s, filter_val):
+    """
+    Evaluates a StringFilter against the 'YYYY-MM-DD' representation of a datetime series without building any
+    strings.  Filters which are a year, month or day prefix ("2000", "2000-01", "2000-01-01") or an exact day
+    ("=2000-01-01") can only match the start of these strings so they are converted to a [start, end] range and
+    compared against the datetime values directly.
+
+    :param s: datetime series
+    :type s: :class:`pandas:pandas.Series`
+    :param filter_val: value of the StringFilter
+    :type filter_val: str
+    :return: boolean mask or `None` if the filter cannot be evaluated this way (true substring match)
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    prefix = filter_val[1:] if filter_val.startswith('=') else filter_val
+    if not DATE_PREFIX.match(prefix) or (filter_val.startswith('=') and len(prefix) != 10):
+        return None
+    try:
+        period = pd.Period(prefix, freq={4: 'A', 7: 'M', 10: 'D'}[len(prefix)])
+        start, end = period.start_time, period.end_time
+    except BaseException:
+        return None
+    if getattr(s.dt, 'tz', None) is not None:
+        s = s.dt.tz_localize(None)  # compare against the same wall-clock dates strftime would produce
+    return ((s >= start) & (s <= end)).values
+
+
+def build_string_codes(s, max_ratio=0.1, min_uniques=100, sample_size=10000):
+    """
+    Dictionary-encodes the string representation of a series if it has low cardinality (at most `max_ratio` of its
+    length unique values, or `min_uniques` for smaller series).
+
+    Series longer than `sample_size` are checked on a random sample first: if the sample holds more unique
+    values than a sample of a uniformly distributed series at the cardinality limit would be expected to, the series
+    is treated as high-cardinality without converting the whole thing to strings.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :param max_ratio: maximum ratio of unique values to rows
+    :type max_ratio: float
+    :param min_uniques: number of unique values always considered low cardinality
+    :type min_uniques: int
+    :param sample_size: number of values checked before encoding long series
+    :type sample_size: int
+    :return: tuple of (codes, unique strings, lowercase unique strings) or `None` for high-cardinality series
+    :rtype: tuple
+    """
+    max_uniques = max(min_uniques, len(s) * max_ratio)
+    if len(s) > sample_size:
+        sample = s.values[np.random.RandomState(0).randint(0, len(s), sample_size)]
+        # expected number of distinct values in a sample drawn from max_uniques equally likely values
+        expected_uniques = -max_uniques * np.expm1(-len(sample) / max_uniques)
+        if len(pd.unique(sample.astype(str))) > expected_uniques:
+            return None
+    codes, uniques = pd.factorize(s.astype(str).values)
+    if len(uniques) > max_uniques:
+        return None
+    uniques = pd.Series(uniques, dtype=object)
+    return codes, uniques.values, uniques.str.lower().values
+
+
+def string_codes(data_id, df, col):
+    """
+    Retrieves the dictionary encoding of a string column from :attr:`dtale.utils.STRING_CODES_CACHE`, building it
+    if necessary.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param col: column name
+    :type col: str
+    :return: output of :meth:`dtale.utils.build_string_codes`
+    """
+    return STRING_CODES_CACHE.get_or_build(data_id, col, lambda: build_string_codes(df[col]), data=df)
+
+
+def build_filter_mask(df, params, data_id=None):
+    """
+    Combine the column filters within the 'filters' property of the parameter dictionary (see
+    :meth:`dtale.utils.filter_df_for_grid` for its structure) into one boolean mask so the dataframe only needs to
+    be sliced once, no matter how many filters are applied.  The 'query' property is not applied.
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param params: arguments from :attr:`flask:flask.request`
+    :type params: dict
+    :param data_id: integer string identifier for a D-Tale process's data, if specified low-cardinality string
+                    columns will be filtered using their dictionary encodings and string representations of datetime
+                    columns needed for substring filters will be cached
+    :type data_id: str, optional
+    :return: boolean mask of rows passing all filters or `None` if there are no filters to apply
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    mask = None
+
+    def _and(df_filter):
+        df_filter = np.asarray(df_filter, dtype=bool)
+        return df_filter if mask is None else (mask & df_filter)
+
     data_type_info = get_dtypes(df)
     for col, filter_cfg in params.get('filters', {}).items():
         filter_val = filter_cfg['value']
@@ -528,18 +841,37 @@ def filter_df_for_grid(df, params):
                         df_filter = df[col] < operation_val
 
                 if df_filter is not None:
-                    df = df[df_filter]
+                    mask = _and(df_filter)
         else:  # this catches StringFilter values
             stringified_col = df[col]
             if classify_type(data_type_info[col]) == 'D':
-                stringified_col = df[col].apply(lambda d: d.strftime('%Y-%m-%d'))
+                df_filter = date_filter_mask(df[col], filter_val)
+                if df_filter is not None:
+                    mask = _and(df_filter)
+                    continue
+
+                def _date_strings():
+                    return df[col].dt.strftime('%Y-%m-%d').fillna('')
+
+                if data_id is None:
+                    stringified_col = _date_strings()
+                else:
+                    stringified_col = DATE_STRINGS_CACHE.get_or_build(data_id, col, _date_strings, data=df)
+            elif data_id is not None and classify_type(data_type_info[col]) == 'S':
+                encoded = string_codes(data_id, df, col)
+                if encoded is not None:  # match against unique values once and select rows by code
+                    codes, uniques, lower_uniques = encoded
+                    if filter_val.startswith('='):
+                        matches = uniques == filter_val[1:]
+                    else:
+                        matches = pd.Series(lower_uniques).str.contains(filter_val.lower(), na=False).values
+                    mask = _and(matches[codes])
+                    continue
             if filter_val.startswith('='):
-                df = df[stringified_col.astype(str) == filter_val[1:]]
+                mask = _and(stringified_col.astype(str) == filter_val[1:])
             else:
-                df = df[stringified_col.astype(str).str.lower().str.contains(filter_val.lower(), na=False)]
-    if params.get('query'):
-        df = df.query(params['query'])
-    return df
+                mask = _and(stringified_col.astype(str).str.lower().str.contains(filter_val.lower(), na=False))
+    return mask
 
 
 def get_dtypes(df):
@@ -620,7 +952,7 @@ def format_grid(df):
     col_types = grid_columns(df)
     f = grid_formatter(col_types)
     return {
-        'results': f.format_dicts(df.itertuples()),
+        'results': f.format_df_dicts(df),
         'columns': col_types
     }
 
@@ -1,9 +1,11 @@
 from __future__ import absolute_import, division
 
+import threading
 import time
 import traceback
 import webbrowser
 from builtins import map, range, str, zip
+from collections import OrderedDict
 from logging import getLogger
 
 from flask import json, redirect, render_template, request
@@ -13,16 +15,23 @@ import pandas as pd
 import requests
 
 from dtale import dtale
-from dtale.charts.utils import build_chart
+from dtale.cache import DataCache, clear_caches
+from dtale.charts.utils import (CHART_CACHE, build_chart, chart_cache_key,
+                                copy_chart_data, date_freq_memo)
 from dtale.cli.clickutils import retrieve_meta_info_and_version
-from dtale.utils import (build_shutdown_url, classify_type, dict_merge,
-                         filter_df_for_grid, find_dtype_formatter,
+from dtale.stats import (approx_uniques, chunked_describe, chunked_histogram,
+                         chunked_histograms, grouped_pearson, masked_ranks,
+                         merge_histogram, numeric_describe_df,
+                         pairwise_pearson, thin_scatter)
+from dtale.utils import (build_filter_mask, build_shutdown_url, classify_type,
+                         dict_merge, find_dtype_formatter,
                          find_selected_column, get_bool_arg, get_dtypes,
                          get_int_arg, get_json_arg, get_str_arg, grid_columns,
                          grid_formatter, json_date, json_float, json_int,
                          json_timestamp, jsonify, make_list,
                          retrieve_grid_params, running_with_flask_debug,
-                         running_with_pytest, sort_df_for_grid)
+                         running_with_pytest, sort_positions_for_grid,
+                         string_codes)
 
 logger = getLogger(__name__)
 
@@ -32,6 +41,26 @@ SETTINGS = {}
 METADATA = {}
 IDX_COL = str('dtale_index')
 
+# row positions of each data_id's data sorted by a given grid sort, bounded to ~512MB (~64M int64 positions)
+SORT_CACHE = DataCache('sort', max_bytes=512 * 1024 ** 2)
+# row positions viewable in the grid per data_id & (filters, query, sort), bounded to ~256MB
+VIEW_CACHE = DataCache('view', max_entries=50, max_bytes=256 * 1024 ** 2)
+# output of the describe popup per data_id & column
+DESCRIBE_CACHE = DataCache('describe', max_entries=1000)
+# histograms per data_id, column & query (plus bin count for bins outside the presets), bounded to ~512MB
+HISTOGRAM_CACHE = DataCache('histogram', max_entries=100, max_bytes=512 * 1024 ** 2)
+BASE_HISTOGRAM_BINS = 1000
+# bin counts offered by the histogram popup, built in the same pass as the base histogram
+PRESET_HISTOGRAM_BINS = [5, 10, 20, 50]
+# cardinality information of datetime columns per data_id & column (see build_date_metadata)
+DATE_METADATA_CACHE = DataCache('date_metadata', max_entries=1000)
+# output of the correlations popup per data_id & query, bounds can be updated using dtale.cache.configure_cache
+CORRELATIONS_CACHE = DataCache('correlations', max_entries=100, max_bytes=256 * 1024 ** 2)
+# sort order of numeric columns per data_id & column used to rank data for Spearman correlations, bounded to ~512MB
+RANKS_CACHE = DataCache('ranks', max_bytes=512 * 1024 ** 2)
+# positions of each data_id's rows ordered by a datetime column along with the sorted dates, bounded to ~512MB
+DATE_INDEX_CACHE = DataCache('date_index', max_bytes=512 * 1024 ** 2)
+
 
 def head_data_id():
     if not len(DATA):
@@ -316,6 +345,84 @@ def build_dtypes_state(data):
     return [_format_dtype(i, c) for i, c in enumerate(data.columns)]
 
 
+def build_date_metadata(date_series):
+    """
+    Helper function to build cardinality information for a datetime column which is used to determine whether it can
+    be used for timeseries or rolling correlations
+
+    :param date_series: datetime data
+    :type date_series: :class:`pandas:pandas.Series`
+    :return: dictionary of {count: non-null values, unique: distinct dates, repeated: dates occurring more than once}
+    :rtype: dict
+    """
+    date_counts = date_series.dropna().value_counts()
+    return dict(count=int(date_counts.sum()), unique=len(date_counts), repeated=int((date_counts > 1).sum()))
+
+
+def date_positions(data_id, date_col, date):
+    """
+    Positions of the rows of a D-Tale process's data containing a specific date.  For timezone-naive datetime columns
+    this is a binary search of the dates sorted once per data_id & column and held in
+    :attr:`dtale.views.DATE_INDEX_CACHE`, any other column falls back to scanning it.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param date_col: name of the date column
+    :type date_col: str
+    :param date: date to look up (EX: '20191201')
+    :type date: str
+    :return: sorted positions
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    data = DATA[data_id]
+    dates = data[date_col]
+    if dates.dtype != np.dtype('datetime64[ns]'):
+        return np.flatnonzero((dates == date).values)
+
+    def _build():
+        order = np.argsort(dates.values, kind='mergesort')
+        return order, dates.values[order]
+
+    order, sorted_dates = DATE_INDEX_CACHE.get_or_build(data_id, date_col, _build, data=data)
+    date = pd.Timestamp(date).to_datetime64()
+    start, end = np.searchsorted(sorted_dates, date, side='left'), np.searchsorted(sorted_dates, date, side='right')
+    return np.sort(order[start:end])
+
+
+def spearman_corr(data_id, data, subset, cols):
+    """
+    Spearman correlation of two columns within a subset of a D-Tale process's data.  Subsets covering a large share
+    of the data are ranked using sort orders of each column cached in :attr:`dtale.views.RANKS_CACHE` (see
+    :meth:`dtale.stats.masked_ranks`), so clicking through column pairs or queries of the same data only sorts each
+    column once.  Smaller subsets, like the rows of a single date, are cheaper to rank directly.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data: all the data of this process
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param subset: rows of `data` (with the same index) for which both columns are non-null
+    :type subset: :class:`pandas:pandas.DataFrame`
+    :param cols: names of the two columns
+    :type cols: list of str
+    :return: correlation (NaN if either column is constant)
+    :rtype: float
+    """
+    s0, s1 = subset[cols[0]], subset[cols[1]]
+    numeric = all(data[col].dtype.kind in 'iuf' for col in cols)
+    if len(subset) < 2 or len(subset) * 8 < len(data) or not numeric or not data.index.is_unique:
+        return s0.corr(s1, method='spearman')
+    positions = data.index.get_indexer(subset.index)
+    mask = np.zeros(len(data), dtype=bool)
+    mask[positions] = True
+    ranks = []
+    for col in cols:
+        values = data[col].values
+        order = RANKS_CACHE.get_or_build(data_id, col, lambda: np.argsort(values, kind='mergesort'), data=data)
+        ranks.append(masked_ranks(values, order, mask)[positions])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.corrcoef(ranks[0], ranks[1])[0, 1]
+
+
 def format_data(data):
     """
     Helper function to build globally managed state pertaining to a D-Tale instances data.  Some updates being made:
@@ -337,7 +444,7 @@ def format_data(data):
     return data, index
 
 
-def startup(url, data=None, data_loader=None, name=None, data_id=None):
+def startup(url, data=None, data_loader=None, name=None, data_id=None, warm_describe=False):
     """
     Loads and stores data globally
      - If data has indexes then it will lock save those columns as locked on the front-end
@@ -349,6 +456,9 @@ def startup(url, data=None, data_loader=None, name=None, data_id=None):
     :param name: string label to apply to your session
     :param data_id: integer id assigned to a piece of data viewable in D-Tale, if this is populated then it will
                     override the data at that id
+    :param warm_describe: if true, the describe popup's details for each column will be computed in a background
+                          thread after loading
+    :type warm_describe: bool, optional
     """
     global DATA, DTYPES, SETTINGS, METADATA
 
@@ -388,8 +498,16 @@ def startup(url, data=None, data_loader=None, name=None, data_id=None):
 
         # in the case that data has been updated we will drop any sorts or filter for ease of use
         SETTINGS[data_id] = dict(locked=curr_locked)
+        clear_caches(data_id)
         DATA[data_id] = data
         DTYPES[data_id] = build_dtypes_state(data)
+        # dictionary-encode low-cardinality string columns up front so string filters only need to scan unique values,
+        # high-cardinality columns are rejected from a sample before being converted to strings
+        for dtype_info in DTYPES[data_id]:
+            if classify_type(dtype_info['dtype']) == 'S':
+                string_codes(data_id, data, dtype_info['name'])
+        if warm_describe:
+            warm_describe_cache(data_id)
         return DtaleData(data_id, url)
     else:
         raise Exception('data loaded is None!')
@@ -409,6 +527,7 @@ def cleanup():
     SETTINGS = {}
     DTYPES = {}
     METADATA = {}
+    clear_caches()
 
 
 def base_render_template(template, data_id, **kwargs):
@@ -632,7 +751,12 @@ def load_describe(column_series, additional_aggs=None):
     :type column_series: :class:`pandas:pandas.Series`
     :return: JSON serializable dictionary of the output from calling :meth:`pandas:pandas.Series.describe`
     """
-    desc = column_series.describe().to_frame().T
+    if additional_aggs and column_series.dtype.kind in 'iuf':
+        # compute all numeric statistics from shared passes rather than one pass per aggregation
+        desc = numeric_describe_df(column_series, additional_aggs=additional_aggs)
+        additional_aggs = None
+    else:
+        desc = column_series.describe().to_frame().T
     if additional_aggs:
         for agg in additional_aggs:
             if agg == 'mode':
@@ -640,12 +764,24 @@ def load_describe(column_series, additional_aggs=None):
                 desc['mode'] = np.nan if len(mode) > 1 else mode[0]
                 continue
             desc[agg] = getattr(column_series, agg)()
+    return format_describe(desc)
+
+
+def format_describe(desc):
+    """
+    Helper function for converting the output from :meth:`pandas:pandas.Series.describe` (as a single-row dataframe)
+    into a JSON serializable format
+
+    :param desc: single-row dataframe of statistics
+    :type desc: :class:`pandas:pandas.DataFrame`
+    :return: JSON serializable dictionary of statistics
+    """
     desc_f_overrides = {
         'I': lambda f, i, c: f.add_int(i, c, as_string=True),
         'F': lambda f, i, c: f.add_float(i, c, precision=4, as_string=True),
     }
     desc_f = grid_formatter(grid_columns(desc), nan_display='nan', overrides=desc_f_overrides)
-    desc = desc_f.format_dict(next(desc.itertuples(), None))
+    desc = desc_f.format_df_dicts(desc)[0]
     if 'count' in desc:
         # pandas always returns 'count' as a float and it adds useless decimal points
         desc['count'] = desc['count'].split('.')[0]
@@ -662,40 +798,163 @@ def describe(data_id, column):
     :type data_id: str
     :param column: required dash separated string "START-END" stating a range of row indexes to be returned
                    to the screen
+    :param approx: boolean from flask.request.args['approx'], if 'true' then distinct counts & most common values
+                   will be estimated (see :meth:`dtale.views.load_column_describe`)
     :return: JSON {
         describe: object representing output from :meth:`pandas:pandas.Series.describe`,
         unique_data: array of unique values when data has <= 100 unique values
+        approximate: True/False (only included when approx is 'true'),
         success: True/False
     }
 
     """
     try:
-        data = DATA[data_id][[column]]
+        return_data = dict(load_column_describe(data_id, column, approx=get_bool_arg(request, 'approx')), success=True)
+        return jsonify(return_data)
+    except BaseException as e:
+        return jsonify(dict(error=str(e), traceback=str(traceback.format_exc())))
+
+
+def load_column_describe(data_id, column, approx=False):
+    """
+    Helper function for building the details displayed in the describe popup for a column, results are cached in
+    :attr:`dtale.views.DESCRIBE_CACHE` per data_id & column until the data is replaced
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param column: column name
+    :type column: str
+    :param approx: if true, distinct counts and most common values will be estimated using sketches (see
+                   :meth:`dtale.stats.approx_uniques`) rather than hashing & sorting the entire column
+    :type approx: bool, optional
+    :return: dictionary of {describe: describe output, uniques: {data: unique values, top: True/False}} (and
+             approximate: True/False when approx is true)
+    :rtype: dict
+    """
+    data = DATA[data_id]
+
+    def _build():
+        col_data = data[[column]]
         additional_aggs = None
         dtype = next((dtype_info['dtype'] for dtype_info in DTYPES[data_id] if dtype_info['name'] == column), None)
         if classify_type(dtype) in ['I', 'F']:
             additional_aggs = ['sum', 'median', 'mode', 'var', 'sem', 'skew', 'kurt']
-        desc = load_describe(data[column], additional_aggs=additional_aggs)
-        return_data = dict(describe=desc, success=True)
-        uniq_vals = data[column].unique()
+        uniq_f = find_dtype_formatter(get_dtypes(col_data)[column])
+        if approx:
+            distinct, top_counts, exact = approx_uniques(col_data[column])
+            if classify_type(dtype) == 'S':  # describe() would count every value to find 'unique', 'top' & 'freq'
+                desc = pd.Series(OrderedDict([
+                    ('count', col_data[column].count()),
+                    ('unique', distinct),
+                    ('top', top_counts.index[0] if len(top_counts) else np.nan),
+                    ('freq', top_counts.iloc[0] if len(top_counts) else np.nan),
+                ]), name=column).to_frame().T
+                return_data = dict(describe=format_describe(desc))
+            elif additional_aggs:
+                # the most common value is already known from the sketch so skip the full count Series.mode makes
+                aggs = [agg for agg in additional_aggs if agg != 'mode']
+                desc = numeric_describe_df(col_data[column], additional_aggs=aggs)
+                tied = len(top_counts) > 1 and top_counts.iloc[0] == top_counts.iloc[1]
+                mode = np.nan if tied or not len(top_counts) else top_counts.index[0]
+                desc.insert(len(desc.columns) - len(aggs) + additional_aggs.index('mode'), 'mode', mode)
+                return_data = dict(describe=format_describe(desc))
+            else:
+                return_data = dict(describe=load_describe(col_data[column]))
+            return_data['describe']['unique'] = json_int(distinct, as_string=True)
+            return_data['uniques'] = dict(
+                data=[uniq_f(u) for u in top_counts.index.values],
+                top=not exact or distinct > 100
+            )
+            return_data['approximate'] = not exact
+            return return_data
+
+        return_data = dict(describe=load_describe(col_data[column], additional_aggs=additional_aggs))
+        uniq_vals = col_data[column].unique()
         if 'unique' not in return_data['describe']:
             return_data['describe']['unique'] = json_int(len(uniq_vals), as_string=True)
-        uniq_f = find_dtype_formatter(get_dtypes(data)[column])
         if len(uniq_vals) <= 100:
             return_data['uniques'] = dict(
                 data=[uniq_f(u) for u in uniq_vals],
                 top=False
             )
         else:  # get top 100 most common values
-            uniq_vals = data[column].value_counts().sort_values(ascending=False).head(100).index.values
+            uniq_vals = col_data[column].value_counts().sort_values(ascending=False).head(100).index.values
             return_data['uniques'] = dict(
                 data=[uniq_f(u) for u in uniq_vals],
                 top=True
             )
+        return return_data
 
-        return jsonify(return_data)
-    except BaseException as e:
-        return jsonify(dict(error=str(e), traceback=str(traceback.format_exc())))
+    return DESCRIBE_CACHE.get_or_build(data_id, (column, 'approx') if approx else column, _build, data=data)
+
+
+def warm_describe_cache(data_id, columns=None):
+    """
+    Populates :attr:`dtale.views.DESCRIBE_CACHE` for the columns of a piece of data in a background daemon thread so
+    the describe popup responds instantly.  Warming stops if the data is replaced before it completes.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param columns: columns to warm, defaults to all columns
+    :type columns: list of str, optional
+    :return: thread populating the cache
+    :rtype: :class:`python:threading.Thread`
+    """
+    data = DATA[data_id]
+    columns = list(data.columns) if columns is None else columns
+
+    def _warm():
+        for column in columns:
+            if DATA.get(data_id) is not data:
+                return
+            try:
+                load_column_describe(data_id, column)
+            except BaseException:
+                logger.debug('unable to warm describe cache for {}[{}]'.format(data_id, column), exc_info=True)
+
+    thread = threading.Thread(target=_warm, name='dtale-describe-{}'.format(data_id))
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def build_grid_positions(data_id, data, params):
+    """
+    Helper function for building the row positions (within the unaltered data) of the rows currently viewable in
+    the grid, in the order they should be displayed, based on the grid's sort, filters & query.
+
+    Positions are cached in :attr:`dtale.views.VIEW_CACHE` by (filters, query, sort) so paging through a filtered
+    view will not re-evaluate filters on each scroll, and the permutation for each sort is cached in
+    :attr:`dtale.views.SORT_CACHE` so changing back to a previous sort will not re-sort data.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data: dataframe
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param params: arguments from :attr:`flask:flask.request`
+    :type params: dict
+    :return: row positions or `None` if all rows are viewable in their natural order
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    def _build():
+        order = None
+        if params.get('sort') is not None:
+            order = SORT_CACHE.get_or_build(
+                data_id, json.dumps(params['sort']), lambda: sort_positions_for_grid(data, params), data=data
+            )
+        mask = build_filter_mask(data, params, data_id=data_id)
+        if params.get('query'):
+            queried = (data if mask is None else data[mask]).query(params['query'])
+            mask = np.zeros(len(data), dtype=bool)
+            mask[data.index.get_indexer(queried.index)] = True
+        if mask is None or mask.all():
+            return order
+        if order is None:
+            return np.flatnonzero(mask)
+        return order[mask[order]]
+
+    view_key = json.dumps([params.get(p) for p in ['filters', 'query', 'sort']], sort_keys=True)
+    return VIEW_CACHE.get_or_build(data_id, view_key, _build, data=data)
 
 
 @dtale.route('/data/<data_id>')
@@ -710,12 +969,14 @@ def get_data(data_id):
     :param query: string from flask.request.args['query'] which is applied to DATA using the query() function
     :param sort: JSON string from flask.request.args['sort'] which is applied to DATA using the sort_values() or
                  sort_index() function.  Here is the JSON structure: [col1,dir1],[col2,dir2],....[coln,dirn]
+    :param columnar: boolean from flask.request.args['columnar'], if 'true' then results will be returned as a
+                     column-oriented block: {dtale_index: [1,...,N2], col1: [val1_1,...,val1_N2],...}
     :return: JSON {
-        results: [
-            {dtale_index: 1, col1: val1_1, ...,colN: valN_1},
+        results: {
+            1: {dtale_index: 1, col1: val1_1, ...,colN: valN_1},
             ...,
-            {dtale_index: N2, col1: val1_N2, ...,colN: valN_N2}
-        ],
+            N2: {dtale_index: N2, col1: val1_N2, ...,colN: valN_N2}
+        },
         columns: [{name: col1, dtype: 'int64'},...,{name: colN, dtype: 'datetime'}],
         total: N2,
         success: True/False
@@ -732,6 +993,7 @@ def get_data(data_id):
             data, _ = format_data(data)
             DATA[data_id] = data
             DTYPES[data_id] = build_dtypes_state(data)
+            clear_caches(data_id)
 
         params = retrieve_grid_params(request)
         ids = get_json_arg(request, 'ids')
@@ -741,34 +1003,34 @@ def get_data(data_id):
         col_types = DTYPES[data_id]
         f = grid_formatter(col_types)
         curr_settings = SETTINGS.get(data_id, {})
-        if curr_settings.get('sort') != params.get('sort'):
-            data = sort_df_for_grid(data, params)
-            DATA[data_id] = data
         if params.get('sort') is not None:
             curr_settings = dict_merge(curr_settings, dict(sort=params['sort']))
         else:
             curr_settings = {k: v for k, v in curr_settings.items() if k != 'sort'}
-        data = filter_df_for_grid(data, params)
         if params.get('query') is not None:
             curr_settings = dict_merge(curr_settings, dict(query=params['query']))
         else:
             curr_settings = {k: v for k, v in curr_settings.items() if k != 'query'}
         SETTINGS[data_id] = curr_settings
 
-        total = len(data)
-        results = {}
+        view = build_grid_positions(data_id, data, params)
+        total = len(data) if view is None else len(view)
+        positions = []
         for sub_range in ids:
             sub_range = list(map(int, sub_range.split('-')))
             if len(sub_range) == 1:
-                sub_df = data.iloc[sub_range[0]:sub_range[0] + 1]
-                sub_df = f.format_dicts(sub_df.itertuples())
-                results[sub_range[0]] = dict_merge({IDX_COL: sub_range[0]}, sub_df[0])
-            else:
-                [start, end] = sub_range
-                sub_df = data.iloc[start:] if end >= len(data) - 1 else data.iloc[start:end + 1]
-                sub_df = f.format_dicts(sub_df.itertuples())
-                for i, d in zip(range(start, end + 1), sub_df):
-                    results[i] = dict_merge({IDX_COL: i}, d)
+                sub_range.append(sub_range[0])
+            [start, end] = sub_range
+            positions += list(range(start, min(end, total - 1) + 1))
+        sub_df = data.take(positions if view is None else view[positions])
+        if get_bool_arg(request, 'columnar'):
+            results = f.format_df_columns(sub_df)
+            results[IDX_COL] = positions
+        else:
+            results = {}
+            for i, d in zip(positions, f.format_df_dicts(sub_df)):
+                d[IDX_COL] = i
+                results[i] = d
         return_data = dict(results=results, columns=[dict(name=IDX_COL, dtype='int64')] + DTYPES[data_id], total=total)
         return jsonify(return_data)
     except BaseException as e:
@@ -784,7 +1046,10 @@ def get_histogram(data_id):
     :type data_id: str
     :param col: string from flask.request.args['col'] containing name of a column in your dataframe
     :param query: string from flask.request.args['query'] which is applied to DATA using the query() function
-    :param bins: the number of bins to display in your histogram, options on the front-end are 5, 10, 20, 50
+    :param bins: the number of bins to display in your histogram, options on the front-end are 5, 10, 20, 50.  These
+                 are built along with a histogram of :attr:`dtale.views.BASE_HISTOGRAM_BINS` bins in one pass over
+                 the data and cached per column & query.  Other bin counts are merged from the base histogram when
+                 its edges line up, otherwise they're built & cached on their own
     :returns: JSON {results: DATA, desc: output from pd.DataFrame[col].describe(), success: True/False}
     """
     col = get_str_arg(request, 'col', 'values')
@@ -792,15 +1057,39 @@ def get_histogram(data_id):
     bins = get_int_arg(request, 'bins', 20)
     try:
         data = DATA[data_id]
-        if query:
-            data = data.query(query)
-
         selected_col = find_selected_column(data, col)
-        data = data[~pd.isnull(data[selected_col])][[selected_col]]
-        hist = np.histogram(data, bins=bins)
 
-        desc = load_describe(data[selected_col])
-        return jsonify(data=[json_float(h) for h in hist[0]], labels=['{0:.1f}'.format(l) for l in hist[1]], desc=desc)
+        def _col_data():
+            return (data.query(query) if query else data)[selected_col]
+
+        def _build_presets():
+            col_data = _col_data()
+            all_bins = PRESET_HISTOGRAM_BINS + [BASE_HISTOGRAM_BINS]
+            if col_data.dtype.kind in 'iuf':  # skips NaNs block by block rather than copying the non-null values
+                hists = dict(zip(all_bins, chunked_histograms(col_data.values, all_bins)))
+                base_counts, base_edges = hists[BASE_HISTOGRAM_BINS]
+                desc = chunked_describe(col_data.values, base_counts, base_edges)
+                return dict(hists=hists, desc=format_describe(pd.DataFrame([desc])))
+            values = col_data[~pd.isnull(col_data)]
+            hists = {b: np.histogram(values, bins=b) for b in all_bins}
+            return dict(hists=hists, desc=load_describe(values))
+
+        def _build_bins():
+            col_data = _col_data()
+            if col_data.dtype.kind in 'iuf':
+                return chunked_histogram(col_data.values, bins)
+            return np.histogram(col_data[~pd.isnull(col_data)], bins=bins)
+
+        presets = HISTOGRAM_CACHE.get_or_build(data_id, (selected_col, query), _build_presets, data=data)
+        hist = presets['hists'].get(bins)
+        if hist is None:
+            base_counts, base_edges = presets['hists'][BASE_HISTOGRAM_BINS]
+            hist = merge_histogram(base_counts, base_edges, bins)
+        if hist is None:
+            hist = HISTOGRAM_CACHE.get_or_build(data_id, (selected_col, query, bins), _build_bins, data=data)
+        return jsonify(
+            data=[json_float(h) for h in hist[0]], labels=['{0:.1f}'.format(l) for l in hist[1]], desc=presets['desc']
+        )
     except BaseException as e:
         return jsonify(dict(error=str(e), traceback=str(traceback.format_exc())))
 
@@ -812,7 +1101,9 @@ def get_correlations(data_id):
     numeric data using :meth:`pandas:pandas.DataFrame.corr`
 
     On large datasets with no :attr:`numpy:numpy.nan` data this code will use :meth:`numpy:numpy.corrcoef`
-    for speed purposes
+    for speed purposes, otherwise pairwise-complete correlations are calculated by
+    :meth:`dtale.stats.pairwise_pearson`.  Results are cached in :attr:`dtale.views.CORRELATIONS_CACHE` per data_id
+    & query until the data is replaced
 
     :param data_id: integer string identifier for a D-Tale process's data
     :type data_id: str
@@ -823,40 +1114,55 @@ def get_correlations(data_id):
     """
     try:
         query = get_str_arg(request, 'query')
-        data = DATA[data_id]
-        data = data.query(query) if query is not None else data
+        curr_data = DATA[data_id]
+
+        def _build():
+            data = curr_data.query(query) if query is not None else curr_data
+
+            valid_corr_cols = []
+            nan_corr_cols = []  # pandas.corr also includes boolean columns
+            valid_date_cols = []
+            rolling = False
+            for col_info in DTYPES[data_id]:
+                name, dtype = map(col_info.get, ['name', 'dtype'])
+                dtype = classify_type(dtype)
+                if dtype in ['I', 'F']:
+                    valid_corr_cols.append(name)
+                    nan_corr_cols.append(name)
+                elif dtype == 'B':
+                    nan_corr_cols.append(name)
+                elif dtype == 'D':
+                    # even if a datetime column exists, we need to make sure that there is enough data for a date
+                    # to warrant a correlation, https://github.com/man-group/dtale/issues/43
+                    if query is None:
+                        date_info = DATE_METADATA_CACHE.get_or_build(
+                            data_id, name, lambda: build_date_metadata(data[name]), data=curr_data
+                        )
+                    else:
+                        date_info = build_date_metadata(data[name])
+                    if date_info['repeated'] > 1:
+                        valid_date_cols.append(name)
+                    elif not date_info['repeated']:
+                        valid_date_cols.append(name)
+                        rolling = True
+
+            if data[valid_corr_cols].isnull().values.any():
+                # pairwise-complete correlations using matrix products rather than looping over column pairs
+                data = pairwise_pearson(data[nan_corr_cols].astype('float64').values)
+                data = pd.DataFrame(data, columns=nan_corr_cols, index=nan_corr_cols)
+            else:
+                # using pandas.corr proved to be quite slow on large datasets so I moved to numpy:
+                # https://stackoverflow.com/questions/48270953/pandas-corr-and-corrwith-very-slow
+                data = np.corrcoef(data[valid_corr_cols].values, rowvar=False)
+                data = pd.DataFrame(data, columns=valid_corr_cols, index=valid_corr_cols)
 
-        valid_corr_cols = []
-        valid_date_cols = []
-        rolling = False
-        for col_info in DTYPES[data_id]:
-            name, dtype = map(col_info.get, ['name', 'dtype'])
-            dtype = classify_type(dtype)
-            if dtype in ['I', 'F']:
-                valid_corr_cols.append(name)
-            elif dtype == 'D':
-                # even if a datetime column exists, we need to make sure that there is enough data for a date
-                # to warrant a correlation, https://github.com/man-group/dtale/issues/43
-                date_counts = data[name].dropna().value_counts()
-                if len(date_counts[date_counts > 1]) > 1:
-                    valid_date_cols.append(name)
-                elif date_counts.eq(1).all():
-                    valid_date_cols.append(name)
-                    rolling = True
-
-        if data[valid_corr_cols].isnull().values.any():
-            data = data.corr(method='pearson')
-        else:
-            # using pandas.corr proved to be quite slow on large datasets so I moved to numpy:
-            # https://stackoverflow.com/questions/48270953/pandas-corr-and-corrwith-very-slow
-            data = np.corrcoef(data[valid_corr_cols].values, rowvar=False)
-            data = pd.DataFrame(data, columns=valid_corr_cols, index=valid_corr_cols)
-
-        data.index.name = str('column')
-        data = data.reset_index()
-        col_types = grid_columns(data)
-        f = grid_formatter(col_types, nan_display=None)
-        return jsonify(data=f.format_dicts(data.itertuples()), dates=valid_date_cols, rolling=rolling)
+            data.index.name = str('column')
+            data = data.reset_index()
+            col_types = grid_columns(data)
+            f = grid_formatter(col_types, nan_display=None)
+            return dict(data=f.format_df_dicts(data), dates=valid_date_cols, rolling=rolling)
+
+        return jsonify(CORRELATIONS_CACHE.get_or_build(data_id, query, _build, data=curr_data))
     except BaseException as e:
         return jsonify(dict(error=str(e), traceback=str(traceback.format_exc())))
 
@@ -887,15 +1193,7 @@ def get_chart_data(data_id):
     } or {error: 'Exception message', traceback: 'Exception stacktrace'}
     """
     try:
-        query = get_str_arg(request, 'query')
-        data = DATA[data_id]
-        if query:
-            try:
-                data = data.query(query)
-            except BaseException as e:
-                return jsonify(dict(error='Invalid query: {}'.format(str(e))))
-            if not len(data):
-                return jsonify(dict(error='query "{}" found no data, please alter'.format(query)))
+        query = (get_str_arg(request, 'query') or '').strip() or None
         x = get_str_arg(request, 'x')
         y = get_json_arg(request, 'y')
         group_col = get_json_arg(request, 'group')
@@ -903,7 +1201,23 @@ def get_chart_data(data_id):
         allow_duplicates = get_bool_arg(request, 'allowDupes')
         window = get_int_arg(request, 'rollingWin')
         comp = get_str_arg(request, 'rollingComp')
-        data = build_chart(data, x, y, group_col, agg, allow_duplicates, rolling_win=window, rolling_comp=comp)
+        cache_key = chart_cache_key(query, x, y, group=group_col, agg=agg, window=window, rolling_comp=comp,
+                                    allow_duplicates=allow_duplicates)
+        chart_data = CHART_CACHE.get(data_id, cache_key, data=DATA[data_id])
+        if chart_data is None:
+            data = DATA[data_id]
+            if query:
+                try:
+                    data = data.query(query)
+                except BaseException as e:
+                    return jsonify(dict(error='Invalid query: {}'.format(str(e))))
+                if not len(data):
+                    return jsonify(dict(error='query "{}" found no data, please alter'.format(query)))
+            freq_memo = date_freq_memo(data_id, DATA[data_id])
+            chart_data = build_chart(data, x, y, group_col, agg, allow_duplicates, rolling_win=window,
+                                     rolling_comp=comp, freq_memo=freq_memo)
+            CHART_CACHE.set(data_id, cache_key, chart_data, data=DATA[data_id])
+        data = copy_chart_data(chart_data)
         data['success'] = True
         return jsonify(data)
     except BaseException as e:
@@ -935,16 +1249,15 @@ def get_correlations_ts(data_id):
         rolling_window = get_int_arg(request, 'rollingWindow')
         if rolling_window:
             [col1, col2] = list(set(cols))
-            data = data[[date_col, col1, col2]].set_index(date_col)
-            data = data[[col1, col2]].rolling(rolling_window).corr().reset_index()
+            # two-series rolling correlation rather than a 2x2 matrix per window
+            corrs = data[col1].rolling(rolling_window).corr(data[col2])
+            data = pd.DataFrame(dict(date=data[date_col].values, corr=corrs.values), columns=['date', 'corr'])
             data = data.dropna()
-            data = data[data['level_1'] == col1][[date_col, col2]]
         else:
-            data = data.groupby(date_col)[list(set(cols))].corr(method='pearson')
-            data.index.names = ['date', 'column']
-            data = data.reset_index()
-            data = data[data.column == cols[0]][['date', cols[1]]]
-        data.columns = ['date', 'corr']
+            # correlation per date computed from per-group sums rather than a 2x2 matrix per groupby group
+            date_codes, dates = pd.factorize(data[date_col], sort=True)
+            corrs = grouped_pearson(date_codes, data[cols[0]].values, data[cols[1]].values, len(dates))
+            data = pd.DataFrame(dict(date=dates, corr=corrs), columns=['date', 'corr'])
         return_data = build_chart(data.fillna(0), 'date', 'corr')
         return_data['success'] = True
         return jsonify(return_data)
@@ -963,6 +1276,8 @@ def get_scatter(data_id):
     :param cols: comma-separated string from flask.request.args['cols'] containing names of two columns in dataframe
     :param dateCol: string from flask.request.args['dateCol'] with name of date-type column in dateframe for timeseries
     :param date: string from flask.request.args['date'] date value in dateCol to filter dataframe to
+    :param sample: boolean flag from flask.request.args['sample'], when data exceeds 15,000 records return a thinned
+                   out subset of points (see :meth:`dtale.stats.thin_scatter`) rather than an error
     :returns: JSON {
         data: [{col1: 0.123, col2: 0.123, index: 1},...,{col1: 0.123, col2: 0.123, index: N}],
         stats: {
@@ -974,7 +1289,9 @@ def get_scatter(data_id):
             spearman: 0.879,
         }
         x: col1,
-        y: col2
+        y: col2,
+        sampled: true (only when points were thinned out),
+        sample_rate: 0.15 (only when points were thinned out)
     } or {error: 'Exception message', traceback: 'Exception stacktrace'}
     """
     cols = get_json_arg(request, 'cols')
@@ -982,6 +1299,7 @@ def get_scatter(data_id):
     date = get_str_arg(request, 'date')
     date_col = get_str_arg(request, 'dateCol')
     rolling = get_bool_arg(request, 'rolling')
+    sample = get_bool_arg(request, 'sample')
     try:
         data = DATA[data_id]
         if query:
@@ -991,19 +1309,23 @@ def get_scatter(data_id):
         y_cols = [cols[1], idx_col]
         if rolling:
             window = get_int_arg(request, 'window')
-            idx = min(data[data[date_col] == date].index) + 1
+            if query:
+                idx = min(data[data[date_col] == date].index) + 1
+            else:
+                idx = min(date_positions(data_id, date_col, date)) + 1
             data = data.iloc[max(idx - window, 0):idx]
             data = data[list(set(cols)) + [date_col]].dropna(how='any')
             y_cols.append(date_col)
         else:
-            data = data[data[date_col] == date] if date else data
+            if date:
+                data = data[data[date_col] == date] if query else data.iloc[date_positions(data_id, date_col, date)]
             data = data[list(set(cols))].dropna(how='any')
 
         data[idx_col] = data.index
         s0 = data[cols[0]]
         s1 = data[cols[1]]
         pearson = s0.corr(s1, method='pearson')
-        spearman = s0.corr(s1, method='spearman')
+        spearman = spearman_corr(data_id, DATA[data_id], data, cols)
         stats = dict(
             pearson='N/A' if pd.isnull(pearson) else pearson,
             spearman='N/A' if pd.isnull(spearman) else spearman,
@@ -1012,15 +1334,24 @@ def get_scatter(data_id):
             only_in_s1=len(data[data[cols[1]].isnull()])
         )
 
+        sample_rate = None
         if len(data) > 15000:
-            return jsonify(
-                stats=stats,
-                error='Dataset exceeds 15,000 records, cannot render scatter. Please apply filter...'
-            )
+            if not sample:
+                return jsonify(
+                    stats=stats,
+                    error='Dataset exceeds 15,000 records, cannot render scatter. Please apply filter...'
+                )
+            # stats above are computed on the full data, only the points rendered are thinned out
+            positions = thin_scatter(s0.values, s1.values, 15000)
+            sample_rate = len(positions) / len(data)
+            data = data.iloc[positions]
         data = build_chart(data, cols[0], y_cols, allow_duplicates=True)
         data['x'] = cols[0]
         data['y'] = cols[1]
         data['stats'] = stats
+        if sample_rate is not None:
+            data['sampled'] = True
+            data['sample_rate'] = sample_rate
         return jsonify(data)
     except BaseException as e:
         return jsonify(dict(error=str(e), traceback=str(traceback.format_exc())))
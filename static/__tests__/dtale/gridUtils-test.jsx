@@ -1,4 +1,4 @@
-import { buildDataProps } from "../../dtale/gridUtils";
+import { buildDataProps, fromColumnar } from "../../dtale/gridUtils";
 import * as t from "../jest-assertions";
 
 describe("gridUtils tests", () => {
@@ -13,4 +13,16 @@ describe("gridUtils tests", () => {
     t.equal(dataProps.view, "", "should handle undefined");
     done();
   });
+
+  test("gridUtils: testing fromColumnar", done => {
+    const results = fromColumnar({ dtale_index: [3, 4], a: [1, 2], b: ["x", "y"] });
+    t.deepEqual(
+      { 3: { dtale_index: 3, a: 1, b: "x" }, 4: { dtale_index: 4, a: 2, b: "y" } },
+      results,
+      "should convert columnar results to rows"
+    );
+    const rows = { 0: { dtale_index: 0, a: 1 } };
+    t.deepEqual(rows, fromColumnar(rows), "should leave row results untouched");
+    done();
+  });
 });
@@ -1,4 +1,5 @@
 import { mount } from "enzyme";
+import _ from "lodash";
 import React from "react";
 
 import { RemovableError } from "../../../RemovableError";
@@ -34,6 +35,9 @@ describe("Describe tests", () => {
         if (url === "/dtale/describe/2/col1") {
           return { error: "describe error" };
         }
+        if (url === "/dtale/describe/3/col1?approx=true") {
+          return { success: true, describe: { count: "4" }, uniques: { data: [1, 2], top: true }, approximate: true };
+        }
         const { urlFetcher } = require("../../redux-test-utils").default;
         return urlFetcher(url);
       })
@@ -87,4 +91,30 @@ describe("Describe tests", () => {
       }, 200);
     }, 200);
   });
+
+  test("Describe: approximate uniques", done => {
+    const Describe = require("../../../popups/Describe").ReactDescribe;
+    buildInnerHTML({ settings: "" });
+    const result = mount(<Describe chartData={chartData} dataId="3" />, {
+      attachTo: document.getElementById("content"),
+    });
+    result.update();
+    setTimeout(() => {
+      result.update();
+      setTimeout(() => {
+        result.update();
+        t.equal(result.find("i.ico-check-box-outline-blank").length, 1, "should default to exact uniques");
+        result
+          .find("button.btn-plain")
+          .first()
+          .simulate("click");
+        setTimeout(() => {
+          result.update();
+          t.equal(result.find("i.ico-check-box").length, 1, "should request approximate uniques");
+          t.ok(_.includes(result.text(), "approximate top 100 most common"), "should label approximate uniques");
+          done();
+        }, 200);
+      }, 200);
+    }, 200);
+  });
 });
@@ -169,7 +169,7 @@ function urlFetcher(url) {
   } else if (url.startsWith("/dtale/dtypes")) {
     return DTYPES;
   } else if (url.startsWith("/dtale/describe")) {
-    const column = _.last(url.split("/"));
+    const column = _.last(_.head(url.split("?")).split("/"));
     if (_.has(DESCRIBE, column)) {
       return _.assignIn({ success: true }, DESCRIBE[column]);
     }
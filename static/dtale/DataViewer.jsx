@@ -107,10 +107,10 @@ class ReactDataViewer extends React.Component {
       this.setState({ loading: false });
       return; // I've seen issues with react-virtualized where it will get into this method without parameters
     }
-    const url = buildURLString(`/dtale/data/${this.props.dataId}?`, params);
+    const url = buildURLString(`/dtale/data/${this.props.dataId}?`, _.assignIn({}, params, { columnar: true }));
     fetchJsonPromise(url)
       .then(data => {
-        const formattedData = _.mapValues(data.results, d =>
+        const formattedData = _.mapValues(gu.fromColumnar(data.results), d =>
           _.mapValues(d, (val, col) => gu.buildDataProps(_.find(data.columns, { name: col }), val, this.state))
         );
         if (data.error) {
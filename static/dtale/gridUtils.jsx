@@ -97,6 +97,30 @@ function getRanges(array) {
   return ranges;
 }
 
+// converts a column-oriented block of results ({dtale_index: [...], col1: [...], ...}) into the row-oriented
+// structure ({rowIdx: {dtale_index: rowIdx, col1: val1, ...}, ...}) used by the grid
+function fromColumnar(results) {
+  if (!_.isPlainObject(results) || !_.isArray(results[IDX])) {
+    return results;
+  }
+  const cols = _.keys(results);
+  return _.reduce(
+    results[IDX],
+    (acc, rowIdx, i) => {
+      acc[rowIdx] = _.reduce(
+        cols,
+        (row, col) => {
+          row[col] = results[col][i];
+          return row;
+        },
+        {}
+      );
+      return acc;
+    },
+    {}
+  );
+}
+
 function calcColWidth({ name, dtype }, { data, rowCount, sortInfo }) {
   let w = DEFAULT_COL_WIDTH;
   if (name === IDX) {
@@ -234,6 +258,7 @@ export {
   getCol,
   getColWidth,
   getRanges,
+  fromColumnar,
   calcColWidth,
   isDateCol,
   isStringCol,
@@ -136,7 +136,7 @@ class ReactCorrelations extends React.Component {
   }
 
   buildScatter(selectedCols, date = null) {
-    const params = { selectedCols, query: this.props.chartData.query };
+    const params = { selectedCols, query: this.props.chartData.query, sample: true };
     if (date) {
       params.dateCol = this.state.selectedDate;
       params.date = date;
@@ -146,7 +146,15 @@ class ReactCorrelations extends React.Component {
       params.window = this.state.window;
     }
     const path = `${BASE_SCATTER_URL}/${this.props.dataId}`;
-    const scatterUrl = buildURL(path, params, ["selectedCols", "query", "date", "dateCol", "rolling", "window"]);
+    const scatterUrl = buildURL(path, params, [
+      "selectedCols",
+      "query",
+      "date",
+      "dateCol",
+      "rolling",
+      "window",
+      "sample",
+    ]);
     if (this.state.scatterUrl === scatterUrl) {
       return;
     }
@@ -159,6 +167,7 @@ class ReactCorrelations extends React.Component {
         date,
         scatterError: null,
         scatterUrl,
+        sampleRate: fetchedChartData.sampled ? fetchedChartData.sample_rate : null,
       };
       if (fetchedChartData.error) {
         newState.scatterError = <RemovableError {...fetchedChartData} />;
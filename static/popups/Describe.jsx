@@ -21,8 +21,10 @@ class ReactDescribe extends React.Component {
       dtypesFilter: null,
       loadingDetails: false,
       details: null,
+      approx: false,
     };
     this.loadDetails = this.loadDetails.bind(this);
+    this.toggleApprox = this.toggleApprox.bind(this);
     this.renderDetails = this.renderDetails.bind(this);
     this.renderUniques = this.renderUniques.bind(this);
     this.createBoxplot = this.createBoxplot.bind(this);
@@ -56,7 +58,8 @@ class ReactDescribe extends React.Component {
 
   loadDetails({ rowData }) {
     this.setState({ loadingDetails: true });
-    fetchJson(`${BASE_DESCRIBE_URL}/${this.props.dataId}/${rowData.name}`, detailData => {
+    const approxParam = this.state.approx ? "?approx=true" : "";
+    fetchJson(`${BASE_DESCRIBE_URL}/${this.props.dataId}/${rowData.name}${approxParam}`, detailData => {
       const newState = {
         detailError: null,
         loadingDtypes: false,
@@ -72,22 +75,29 @@ class ReactDescribe extends React.Component {
         this.setState(newState);
         return;
       }
-      newState.details = _.pick(detailData, ["describe", "uniques"]);
+      newState.details = _.pick(detailData, ["describe", "uniques", "approximate"]);
       newState.details.name = rowData.name;
       this.setState(newState, this.createBoxplot);
     });
   }
 
+  toggleApprox() {
+    const name = _.get(this.state, "details.name");
+    const callback = _.isUndefined(name) ? _.noop : () => this.loadDetails({ rowData: { name } });
+    this.setState({ approx: !this.state.approx }, callback);
+  }
+
   renderUniques() {
     const uniques = _.get(this.state, "details.uniques") || {};
     if (_.isEmpty(uniques.data)) {
       return null;
     }
+    const approximate = _.get(this.state, "details.approximate", false);
     return (
       <div key={3} className="row">
         <div className="col-sm-12">
           <span className="font-weight-bold" style={{ fontSize: "120%" }}>
-            {`Unique Values${uniques.top ? " (top 100 most common)" : ""}:`}
+            {`Unique Values${uniques.top ? ` (${approximate ? "approximate " : ""}top 100 most common)` : ""}:`}
           </span>
           <br />
           <span>{_.join(uniques.top ? uniques.data : _.sortBy(uniques.data), ", ")}</span>
@@ -161,7 +171,14 @@ class ReactDescribe extends React.Component {
     return [
       <div key={1} className="row">
         <div className="col-sm-12">
-          <h1>{details.name}</h1>
+          <h1 className="d-inline">{details.name}</h1>
+          <button
+            className="btn btn-plain float-right"
+            onClick={this.toggleApprox}
+            data-tip="Estimate distinct counts & most common values rather than counting every value">
+            <i className={this.state.approx ? "ico-check-box" : "ico-check-box-outline-blank"} />
+            <span className="pl-3">Approximate</span>
+          </button>
         </div>
       </div>,
       <div key={2} className="row">
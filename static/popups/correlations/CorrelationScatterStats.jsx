@@ -55,6 +55,11 @@ class CorrelationScatterStats extends React.Component {
       </div>,
       <div key={1} style={{ marginTop: "-.5em" }}>
         <small>(Click on any point in the scatter to filter the grid down to that record)</small>
+        {this.props.sampleRate && (
+          <small className="pl-3">
+            {`(Displaying a sample of ${corrUtils.percent(this.props.sampleRate)} of the points)`}
+          </small>
+        )}
       </div>,
     ];
   }
@@ -72,6 +77,7 @@ CorrelationScatterStats.propTypes = {
   }),
   rolling: PropTypes.bool,
   window: PropTypes.number,
+  sampleRate: PropTypes.number,
 };
 
 export default CorrelationScatterStats;
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dtale.cache import (DataCache, clear_caches, configure_cache,
+                         data_signature, sizeof)
+
+
+@pytest.mark.unit
+def test_data_cache():
+    cache = DataCache('test', max_entries=2)
+    df = pd.DataFrame(dict(a=[1, 2, 3]))
+    assert cache.get('1', 'a', data=df) is None
+    assert cache.get_or_build('1', 'a', lambda: 'a_val', data=df) == 'a_val'
+    assert cache.get_or_build('1', 'a', lambda: 'other', data=df) == 'a_val'
+
+    other_df = pd.DataFrame(dict(a=[1, 2, 3]))
+    assert cache.get('1', 'a', data=other_df) is None, 'entries built from other data should not be returned'
+    assert ('1', 'a') not in cache
+
+    cache.set('1', 'a', 'a_val', data=df)
+    df.loc[1, 'a'] = 5
+    assert cache.get('1', 'a', data=df) is None, 'entries should not be returned once data is edited in place'
+    assert ('1', 'a') not in cache
+
+    cache.set('1', 'a', 'a_val')
+    cache.set('1', 'b', 'b_val')
+    assert cache.get('1', 'a') == 'a_val'
+    cache.set('2', 'c', 'c_val')
+    assert len(cache) == 2
+    assert ('1', 'b') not in cache, 'least recently used entry should be evicted'
+
+    clear_caches('2')
+    assert len(cache) == 1 and ('1', 'a') in cache
+    clear_caches()
+    assert not len(cache) and cache.nbytes == 0
+
+
+@pytest.mark.unit
+def test_data_cache_max_bytes():
+    cache = DataCache('test', max_bytes=sizeof(np.arange(10)) * 2)
+    cache.set('1', 'a', np.arange(10))
+    cache.set('1', 'b', np.arange(10))
+    assert len(cache) == 2
+    cache.set('1', 'c', np.arange(10))
+    assert len(cache) == 2 and ('1', 'a') not in cache
+    cache.set('1', 'd', np.arange(100))
+    assert ('1', 'd') not in cache, 'values larger than max_bytes should not be stored'
+    assert cache.nbytes == sizeof(np.arange(10)) * 2
+
+
+@pytest.mark.unit
+def test_configure_cache():
+    cache = DataCache('test_configure')
+    for key in ['a', 'b', 'c']:
+        cache.set('1', key, key)
+    configure_cache('test_configure', max_entries=1)
+    assert len(cache) == 1 and ('1', 'c') in cache
+    assert cache.max_entries == 1 and cache.max_bytes is None
+    with pytest.raises(ValueError):
+        configure_cache('missing', max_entries=1)
+
+
+@pytest.mark.unit
+def test_data_signature():
+    df = pd.DataFrame(dict(a=[1, 2, 3], b=['x', 'y', 'z']))
+    signature = data_signature(df)
+    assert data_signature(df.copy()) == signature
+    df['a'] = [1.0, 2.0, 3.0]
+    assert data_signature(df) != signature, 'dtype changes should change the signature'
+    signature = data_signature(df)
+    df.loc[2, 'b'] = 'foo'
+    assert data_signature(df) != signature, 'value changes should change the signature'
+    assert data_signature(df.rename(columns={'a': 'c'})) != data_signature(df)
+    assert data_signature(pd.DataFrame(dict(a=[[1], [2]]))) != data_signature(pd.DataFrame(dict(a=[[1], [3]])))
+    assert data_signature(pd.DataFrame()) == data_signature(pd.DataFrame())
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -18,6 +19,103 @@ def test_date_freq_handler():
     assert s.dt.strftime('%Y%m%d').values[0] == '20200131'
 
 
+@pytest.mark.unit
+def test_date_freq_memo():
+    df = pd.DataFrame(dict(date=pd.to_datetime(['20200101', None, '20200215', '20200101']), foo=[1, 2, 3, 4]))
+    memo = chart_utils.date_freq_memo('1', df)
+    s = chart_utils.date_freq_handler(df, memo=memo)('date|M')
+    assert list(s.dt.strftime('%Y%m%d').fillna('')) == ['20200131', '', '20200229', '20200131']
+    assert chart_utils.DATE_FREQ_CACHE.get('1', ('date', 'M'), data=df) is not None
+
+    subset = df.query('foo > 2')
+    s = chart_utils.date_freq_handler(subset, memo=memo)('date|WD')
+    assert list(s.index) == [2, 3]
+    assert list(s.values) == [5, 2]
+    assert chart_utils.DATE_FREQ_CACHE.get('1', ('date', 'WD'), data=df) is not None
+
+
+@pytest.mark.unit
+def test_chart_cache_key():
+    assert chart_utils.chart_cache_key('', 'a', ['b'], window=5, rolling_comp='mean') == chart_utils.chart_cache_key(
+        None, 'a', 'b', agg=None
+    )
+    assert chart_utils.chart_cache_key(x='a', y=['b'], agg='rolling', window=5) != chart_utils.chart_cache_key(
+        x='a', y=['b'], agg='rolling', window=10
+    )
+
+
+@pytest.mark.unit
+def test_copy_chart_data():
+    chart_data = dict(data={'all': {'x': [1, 2], 'y': [3, 4]}}, min={'y': 3}, max={'y': 4})
+    copy = chart_utils.copy_chart_data(chart_data)
+    copy['success'] = True
+    copy['data']['all'] = {'x': [0, 1]}
+    copy['min']['y'] = 0
+    assert chart_data == dict(data={'all': {'x': [1, 2], 'y': [3, 4]}}, min={'y': 3}, max={'y': 4})
+
+
+@pytest.mark.unit
+def test_has_duplicates():
+    df = pd.DataFrame(dict(a=[1, 2, None, 3], b=['x', 'y', 'x', None], c=[1, 1, 1, 1]))
+    assert not chart_utils.has_duplicates(df[['a']])
+    assert chart_utils.has_duplicates(df[['b']])
+    assert not chart_utils.has_duplicates(df[['a', 'b']])
+    assert chart_utils.has_duplicates(df[['c', 'c']])
+    assert chart_utils.has_duplicates(pd.DataFrame(dict(a=[None, None], b=[1, 1])))
+    assert not chart_utils.has_duplicates(df[['a', 'b', 'c']])
+
+
+@pytest.mark.unit
+def test_check_exceptions():
+    df = pd.DataFrame(dict(x=[1, 1, 2]))
+    with pytest.raises(Exception) as error:
+        chart_utils.check_exceptions(df, False, data_limit=2)
+    assert 'exceeds 2 records' in str(error.value)
+    with pytest.raises(Exception) as error:
+        chart_utils.check_exceptions(df, False)
+    assert 'contains duplicates' in str(error.value)
+    chart_utils.check_exceptions(df, True)
+
+
+@pytest.mark.unit
+def test_downsample_positions():
+    df = pd.DataFrame(dict(x=np.arange(100000), a=np.random.randn(100000), b=np.random.randn(100000)))
+    df.loc[54321, 'a'] = 100
+    df.loc[12345, 'b'] = -100
+    positions = chart_utils.downsample_positions(df, ['a', 'b'], 15000)
+    assert len(positions) <= 15000
+    assert (np.diff(positions) > 0).all()
+    assert {0, 12345, 54321, 99999}.issubset(positions)
+    np.testing.assert_array_equal(chart_utils.downsample_positions(df[:100], ['a'], 15000), np.arange(100))
+
+
+@pytest.mark.unit
+def test_build_chart_downsample():
+    df = pd.DataFrame(dict(x=np.arange(20000), y=np.sin(np.arange(20000) / 100.0)))
+    with pytest.raises(Exception) as error:
+        chart_utils.build_chart(df, 'x', 'y')
+    assert 'exceeds 15000 records' in str(error.value)
+    output = chart_utils.build_chart(df, 'x', 'y', downsample=True)
+    assert output['sampled']
+    assert len(output['data']['all']['x']) <= 15000
+    assert output['max'] == {'x': 19999, 'y': 1.0}
+
+
+@pytest.mark.unit
+def test_build_chart_groups(unittest):
+    df = pd.DataFrame(dict(
+        x=[3, 1, 2, 1, 2, 3], y=[1.5, 2.5, 3.5, 4.5, 5.5, np.nan], g=['b', 'b', 'b', 'a', 'a', 'a'],
+        h=[2, 1, 1, 1, 1, 1]
+    ))
+    output = chart_utils.build_chart(df, 'x', 'y', group_col=['g', 'h'])
+    unittest.assertEqual(output['data'], {
+        'a/1': {'g': ['a', 'a'], 'h': [1, 1], 'x': [1, 2], 'y': [4.5, 5.5]},
+        'b/1': {'g': ['b', 'b'], 'h': [1, 1], 'x': [1, 2], 'y': [2.5, 3.5]},
+        'b/2': {'g': ['b'], 'h': [2], 'x': [3], 'y': [1.5]},
+    })
+    assert list(output['data']) == ['a/1', 'b/1', 'b/2']
+
+
 @pytest.mark.unit
 def test_build_agg_data():
     with pytest.raises(NotImplementedError):
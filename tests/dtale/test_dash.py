@@ -910,6 +910,11 @@ def test_build_figure_data(unittest):
         fig_data = build_figure_data('/charts/1', x='a', y=['b'], chart_type='line')
         assert 'error' in fig_data and 'traceback' in fig_data
 
+    df = pd.DataFrame(dict(a=[1, 2, 3], b=[4, 5, 6]))
+    with mock.patch('dtale.dash_application.charts.DATA', {'1': df}):
+        fig_data = build_figure_data('1', query=' ', x='a', y=['b'], chart_type='line')
+        unittest.assertEqual(fig_data['data']['all']['b'], [4, 5, 6])
+
 
 @pytest.mark.unit
 def test_chart_wrapper(unittest):
@@ -957,6 +962,22 @@ def test_build_chart_type():
             assert output[0].children[1].children == 'chart type: unknown'
 
 
+@pytest.mark.unit
+def test_build_chart_sampled_line():
+    from dtale.dash_application.charts import build_chart
+
+    import dtale.views as views
+
+    with app.test_client() as c:
+        with ExitStack() as stack:
+            df, _ = views.format_data(pd.DataFrame(dict(a=np.arange(20000), b=np.random.randn(20000))))
+            stack.enter_context(mock.patch('dtale.dash_application.charts.DATA', {c.port: df}))
+            output, _ = build_chart(c.port, chart_type='line', x='a', y=['b'], yaxis={})
+            figure = output.children[1].figure
+            assert figure['layout']['title']['text'] == 'b by a (sampled)'
+            assert len(figure['data'][0]['x']) <= 15000
+
+
 @pytest.mark.unit
 def test_update_label_for_freq(unittest):
     unittest.assertEqual(update_label_for_freq(['date|WD', 'date|D', 'foo']), 'date (Weekday), date, foo')
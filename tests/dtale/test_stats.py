@@ -0,0 +1,229 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dtale.stats import (approx_uniques, approx_value_counts, chunked_describe,
+                         chunked_histogram, chunked_histograms,
+                         grouped_pearson, hash_values, hll_estimate,
+                         hll_registers, masked_ranks, merge_histogram,
+                         numeric_describe, numeric_describe_df,
+                         pairwise_pearson, thin_scatter)
+
+AGGS = ['sum', 'median', 'mode', 'var', 'sem', 'skew', 'kurt']
+
+
+def _pandas_describe(s):
+    expected = s.describe().to_dict()
+    for agg in AGGS:
+        if agg == 'mode':
+            mode = s.mode().values
+            expected['mode'] = np.nan if len(mode) != 1 else mode[0]
+            continue
+        expected[agg] = getattr(s, agg)()
+    return expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('s', [
+    pd.Series(np.random.randn(1000)),
+    pd.Series(np.random.randint(0, 100, 1000)),
+    pd.Series([1.0, np.nan, 3.0, 7.0, np.nan, 2.0, 2.0]),
+    pd.Series([5, 5, 5, 5]),
+    pd.Series([1.0, 2.0]),
+    pd.Series([1.0]),
+    pd.Series([2.0, np.inf]),
+    pd.Series([np.nan, np.nan]),
+])
+def test_numeric_describe(s):
+    stats = numeric_describe(s)
+    expected = _pandas_describe(s)
+    assert list(stats.keys())[:8] == list(expected.keys())[:8]
+    for key, val in expected.items():
+        np.testing.assert_allclose(stats[key], val, rtol=1e-10, atol=1e-12, err_msg=key)
+
+
+@pytest.mark.unit
+def test_numeric_describe_df():
+    s = pd.Series([1, 2, 2, 4], name='a')
+    desc = numeric_describe_df(s, additional_aggs=['sum', 'mode', 'skew'])
+    assert list(desc.columns) == ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max', 'sum', 'mode', 'skew']
+    assert desc['sum'].dtype == np.int64 and desc['mode'].dtype == np.int64
+    assert desc['count'].values[0] == 4.0
+
+
+@pytest.mark.unit
+def test_hll():
+    values = np.arange(50000)
+    estimate = hll_estimate(hll_registers(hash_values(values)))
+    assert abs(estimate - 50000) / 50000.0 < 0.05
+    registers = np.maximum(hll_registers(hash_values(values[:25000])), hll_registers(hash_values(values[25000:])))
+    assert hll_estimate(registers) == estimate, 'registers should be mergeable'
+    assert hll_estimate(hll_registers(hash_values(np.array(['a', 'b', 'a'], dtype=object)))) == 2
+
+
+@pytest.mark.unit
+def test_approx_uniques():
+    s = pd.Series(['a', 'b', 'a', None, np.nan])
+    distinct, counts, exact = approx_uniques(s)
+    assert exact and distinct == 2
+    assert counts.to_dict() == {'a': 2, 'b': 1}
+
+    s = pd.Series(np.concatenate([np.arange(20000), np.repeat([-1, -2], 500)]))
+    counts, error = approx_value_counts(s, capacity=100, chunk_size=5000)
+    assert error > 0
+    assert sorted(counts.index[:2]) == [-2, -1]
+    assert all(counts.iloc[:2] + error >= 500)
+
+    distinct, counts, exact = approx_uniques(s, top=5)
+    assert not exact and abs(distinct - 20002) / 20002.0 < 0.05
+    assert len(counts) == 5
+
+    distinct, counts, exact = approx_uniques(s, top=5, chunk_size=3000)
+    assert not exact and abs(distinct - 20002) / 20002.0 < 0.05
+    assert counts.index.dtype == s.dtype and sorted(counts.index[:2]) == [-2, -1]
+
+    # mostly distinct objects are counted by hash, their values are recovered from the retained hashes
+    s = pd.Series(np.concatenate([np.arange(20000).astype(str), ['a'] * 700, ['b'] * 600, [None] * 10]), dtype=object)
+    distinct, counts, exact = approx_uniques(s, top=3, chunk_size=3000)
+    assert not exact and abs(distinct - 20002) / 20002.0 < 0.05
+    assert list(counts.index[:2]) == ['a', 'b'] and list(counts.values[:2]) == [700, 600]
+
+    s = pd.Series(np.concatenate([np.arange(500).astype(str), ['a'] * 50]), dtype=object)
+    distinct, counts, exact = approx_uniques(s, top=3, chunk_size=100)
+    assert exact and distinct == 501 and counts.index[0] == 'a' and counts.iloc[0] == 50
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('values', [
+    np.random.randn(5000),
+    np.random.randint(0, 37, 5000),
+    np.ones(10),
+    np.arange(100.0),
+])
+def test_histograms(values):
+    base_counts, base_edges = np.histogram(values, bins=1000)
+    for bins in [5, 10, 20, 50, 7]:
+        expected_counts, expected_edges = np.histogram(values, bins=bins)
+        merged = merge_histogram(base_counts, base_edges, bins)
+        if merged is not None:
+            np.testing.assert_array_equal(merged[0], expected_counts)
+            np.testing.assert_array_equal(merged[1], expected_edges)
+    assert merge_histogram(base_counts, base_edges, 7) is None
+
+
+@pytest.mark.unit
+def test_chunked_histogram():
+    values = np.random.randn(10000)
+    values[::7] = np.nan
+    for bins in [5, 20, 1000]:
+        counts, edges = chunked_histogram(values, bins, chunk_size=999)
+        expected_counts, expected_edges = np.histogram(values[~np.isnan(values)], bins=bins)
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_array_equal(edges, expected_edges)
+
+    for values in [np.ones(10, dtype='int64'), np.array([], dtype='float64'), np.array([np.nan, np.nan])]:
+        counts, edges = chunked_histogram(values, 5, chunk_size=3)
+        expected_counts, expected_edges = np.histogram(values[~np.isnan(values)], bins=5)
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_array_equal(edges, expected_edges)
+
+    values = np.random.randn(10000)
+    values[::7] = np.nan
+    hists = chunked_histograms(values, [5, 10, 20, 50, 1000], chunk_size=999)
+    for bins, (counts, edges) in zip([5, 10, 20, 50, 1000], hists):
+        expected_counts, expected_edges = np.histogram(values[~np.isnan(values)], bins=bins)
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_array_equal(edges, expected_edges)
+
+    with pytest.raises(ValueError) as error:
+        chunked_histogram(np.array([1.0, np.inf]), 5)
+    assert 'autodetected range of [1.0, inf] is not finite' in str(error.value)
+
+
+@pytest.mark.unit
+def test_chunked_describe():
+    random = np.random.RandomState(0)
+    skewed = np.concatenate([np.zeros(500), [1e9], random.randn(50)])  # most values share a bin of the histogram
+    tiny = np.concatenate([random.randn(300) * 1e-12, [1.0, np.nan]])
+    for values in [random.randn(1001), skewed, tiny, random.randint(0, 5, 300), np.arange(7.0),
+                   np.array([np.nan, 2.0]), np.array([np.nan])]:
+        expected = pd.Series(values).describe()
+        for chunk_size in [7, 1000000]:
+            counts, edges = chunked_histogram(values, 1000, chunk_size=chunk_size)
+            output = chunked_describe(values, counts, edges, chunk_size=chunk_size)
+            assert list(output) == list(expected.index)
+            np.testing.assert_allclose(list(output.values()), expected.values, rtol=1e-12)
+
+
+@pytest.mark.unit
+def test_pairwise_pearson():
+    df = pd.DataFrame(np.random.randn(500, 6))
+    df[df > 1.2] = np.nan
+    df[2] = 5.0
+    df.loc[:250, 3] = np.nan
+    df[4] = df[0] * 3 - 1
+    df[5] = np.nan
+    df.loc[0, 5] = 1.0
+    expected = df.corr().values
+    result = pairwise_pearson(df.values)
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+    assert result[0, 4] == pytest.approx(1.0)
+
+    df = pd.DataFrame(dict(a=[1., 2, 3, 4, np.nan], b=[2., 1, 4, 3, 5], c=[1., np.inf, 2, 3, 4], d=[-np.inf] * 5))
+    expected = df.corr().values
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = pairwise_pearson(df.values)
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+    assert result[0, 2] == pytest.approx(0.982, abs=1e-3)
+
+
+@pytest.mark.unit
+def test_grouped_pearson():
+    df = pd.DataFrame(dict(
+        date=np.repeat(pd.date_range('2000-01-01', periods=20), 30),
+        x=np.random.randn(600),
+        y=np.random.randn(600)
+    ))
+    df.loc[::7, 'x'] = np.nan
+    df.loc[df.date == '2000-01-03', 'y'] = 2.5
+    df.loc[df.date == '2000-01-04', 'x'] = np.nan
+    expected = df.groupby('date')[['x', 'y']].corr()
+    expected.index.names = ['date', 'column']
+    expected = expected.reset_index()
+    expected = expected[expected.column == 'x']['y'].values
+
+    codes, dates = pd.factorize(df['date'], sort=True)
+    result = grouped_pearson(codes, df['x'].values, df['y'].values, len(dates))
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+@pytest.mark.unit
+def test_thin_scatter():
+    x = np.random.randn(50000)
+    y = x + np.random.randn(50000) * 0.1
+    x[123] = 100
+    result = thin_scatter(x, y, 15000)
+    assert 14000 < len(result) <= 15000
+    assert 123 in result
+    assert (np.diff(result) > 0).all()
+    np.testing.assert_array_equal(result, thin_scatter(x, y, 15000))
+    np.testing.assert_array_equal(thin_scatter(x[:100], y[:100], 15000), np.arange(100))
+    assert len(thin_scatter(np.random.rand(30000), np.random.rand(30000), 5000)) == 5000
+
+
+@pytest.mark.unit
+def test_masked_ranks():
+    s = pd.Series(np.random.randint(0, 20, 1000).astype('float64'))
+    s[::11] = np.nan
+    order = np.argsort(s.values, kind='mergesort')
+    mask = (np.arange(1000) % 3 != 0) & s.notnull().values
+    result = masked_ranks(s.values, order, mask)
+    np.testing.assert_array_equal(result[mask], s[mask].rank().values)
+    assert np.isnan(result[~mask]).all()
+    np.testing.assert_array_equal(masked_ranks(s.values, order)[s.notnull().values], s.dropna().rank().values)
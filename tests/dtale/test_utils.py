@@ -93,12 +93,22 @@ def test_formatters(unittest):
             pd.DataFrame(data, columns=['str', 'int', 'float', 'date', 'timestamp', 'json', 'ts_date'])
         ),
         {
-            'int': [1], 'timestamp': [1525075200000], 'float': [1.666667], 'ts_date': ['2018-04-30 16:36:44'],
-            'json': [{'a': 1}], 'str': ['hello'], 'date': ['2018-04-30 04:00:00']
+            'int': [1], 'timestamp': [1525060800000], 'float': [1.666667], 'ts_date': ['2018-04-30 12:36:44'],
+            'json': [{'a': 1}], 'str': ['hello'], 'date': ['2018-04-30']
         }
     )
 
 
+@pytest.mark.unit
+def test_sort_df_for_grid():
+    df = pd.DataFrame(dict(a=[2, 1, 2, 3], b=[1.0, 4.0, 3.0, 2.0]), index=[3, 2, 1, 0])
+    params = dict(sort=[['a', 'DESC'], ['b', 'ASC']])
+    np.testing.assert_array_equal(utils.sort_positions_for_grid(df, params), [3, 0, 2, 1])
+    pdt.assert_frame_equal(utils.sort_df_for_grid(df, params), df.sort_values(['a', 'b'], ascending=[False, True]))
+    assert utils.sort_positions_for_grid(df, {}) is None
+    pdt.assert_frame_equal(utils.sort_df_for_grid(df, {}), df.sort_index())
+
+
 @pytest.mark.unit
 def test_filter_df_for_grid(test_data):
     req = build_req_tuple({
@@ -135,6 +145,59 @@ def test_filter_df_for_grid(test_data):
     results = utils.filter_df_for_grid(test_data, utils.retrieve_grid_params(req))
     pdt.assert_frame_equal(results, test_data[test_data.security_id == 1])
 
+    req = build_req_tuple({
+        'filters': json.dumps({
+            'security_id': {'type': 'NumericFilter', 'value': [{'value': 5, 'type': 4}]},
+            'baz': {'type': 'StringFilter', 'value': 'BA'}
+        })
+    })
+    mask = utils.build_filter_mask(test_data, utils.retrieve_grid_params(req))
+    np.testing.assert_array_equal(mask, (test_data.security_id < 5).values)
+    assert utils.build_filter_mask(test_data, dict(query='security_id == 1')) is None
+
+
+@pytest.mark.unit
+def test_date_filter_mask():
+    dates = pd.Series(pd.date_range('2019-12-30', periods=5).tolist() + [pd.NaT])
+    np.testing.assert_array_equal(utils.date_filter_mask(dates, '2020'), [False, False, True, True, True, False])
+    np.testing.assert_array_equal(utils.date_filter_mask(dates, '2019-12'), [True, True, False, False, False, False])
+    np.testing.assert_array_equal(
+        utils.date_filter_mask(dates, '=2020-01-01'), [False, False, True, False, False, False]
+    )
+    tz_dates = pd.Series(pd.date_range('2019-12-31 23:00', periods=2, freq='H', tz='US/Eastern'))
+    np.testing.assert_array_equal(utils.date_filter_mask(tz_dates, '2020-01-01'), [False, True])
+    assert utils.date_filter_mask(dates, '-01') is None
+    assert utils.date_filter_mask(dates, '=2020') is None
+    assert utils.date_filter_mask(dates, '2020-13') is None
+
+    df = pd.DataFrame(dict(date=dates))
+    params = dict(filters={'date': {'type': 'StringFilter', 'value': '-31'}})
+    mask = utils.build_filter_mask(df, params, data_id='1')
+    np.testing.assert_array_equal(mask, [False, True, False, False, False, False])
+    assert ('1', 'date') in utils.DATE_STRINGS_CACHE
+    utils.DATE_STRINGS_CACHE.clear()
+
+
+@pytest.mark.unit
+def test_string_codes():
+    s = pd.Series(['Foo', 'bar', None, 'foo', np.nan, 'BAR'] * 10)
+    codes, uniques, lower_uniques = utils.build_string_codes(s)
+    np.testing.assert_array_equal(uniques[codes], s.astype(str).values)
+    assert utils.build_string_codes(pd.Series(list(map(str, range(200))))) is None
+    with mock.patch('pandas.factorize', mock.Mock(side_effect=Exception('should skip encoding'))):
+        assert utils.build_string_codes(pd.Series(list(map(str, range(50000))))) is None
+    codes, uniques, _ = utils.build_string_codes(pd.Series(list(map(str, range(3000)))).repeat(20))
+    assert len(uniques) == 3000
+
+    df = pd.DataFrame(dict(a=s))
+    for filter_val in ['foo', 'BA', 'f.o', '=Foo', '=foo', 'nan', '=None', 'missing']:
+        params = dict(filters={'a': {'type': 'StringFilter', 'value': filter_val}})
+        np.testing.assert_array_equal(
+            utils.build_filter_mask(df, params, data_id='1'), utils.build_filter_mask(df, params)
+        )
+    assert ('1', 'a') in utils.STRING_CODES_CACHE
+    utils.STRING_CODES_CACHE.clear()
+
     req = build_req_tuple({'page': 1, 'page_size': 50})
     page, page_size = utils.retrieve_grid_params(req, props=['page', 'page_size'])
     assert page == 1
@@ -244,3 +307,36 @@ def test_json_string2(builtin_pkg):
         stack.enter_context(mock.patch('{}.str'.format(builtin_pkg), mock.Mock(side_effect=MockStr)))
         stack.enter_context(mock.patch('dtale.utils.logger', MockLogger()))
         utils.json_string(TestStr(), nan_display='nan')
+
+
+@pytest.mark.unit
+def test_format_df_dicts(unittest):
+    df = pd.DataFrame(dict(
+        str=['hello', None, np.nan, '', 0],
+        int=[1, 2, 3, 4, 5],
+        float=[1.6666666, np.nan, np.inf, -np.inf, 2.0],
+        float_int=[1.0, np.nan, 3.5, -4.5, np.inf],
+        date=pd.to_datetime(['20180430', '20180430 12:36:44', None, '20180501', '20180502']),
+        tz_date=pd.to_datetime(['20180430', '20180430 12:36:44', None, '20180501', '20180502']).tz_localize(
+            'US/Eastern'
+        ),
+        obj_date=[pd.Timestamp('20180430'), None, 'hello', 1, pd.Timestamp('20180501 01:00')],
+        json=[{'a': 1}, None, np.nan, 'hello', 1],
+    ), columns=['str', 'int', 'float', 'float_int', 'date', 'tz_date', 'obj_date', 'json'])
+
+    for nan_display in ['', None, 'nan']:
+        formatters = utils.JSONFormatter(nan_display)
+        formatters.add_string(1, name='str')
+        formatters.add_int(2, name='int')
+        formatters.add_float(3, name='float')
+        formatters.add_int(4, name='float_int', as_string=True)
+        formatters.add_date(5, name='date')
+        formatters.add_date(6, name='tz_date')
+        formatters.add_date(7, name='obj_date', fmt='%Y%m%d')
+        formatters.add_json(8, name='json')
+        unittest.assertEqual(formatters.format_df_dicts(df), formatters.format_dicts(df.itertuples()))
+
+    assert utils.JSONFormatter().format_df_dicts(df) == [{}] * 5
+    assert utils.json_ints(np.array([True, False])) == [1, 0]
+    assert utils.json_ints(np.array([1.5, np.nan, 1e20])) == [1, '', int(1e20)]
+    assert utils.json_floats(np.array([1.123456789, np.nan], dtype='float32'), precision=6) == [1.123457, 'nan']
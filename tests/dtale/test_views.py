@@ -266,6 +266,84 @@ def test_dtypes(test_data):
             assert response_data['describe']['max'] == 'inf'
 
 
+@pytest.mark.unit
+def test_describe_cache(test_data):
+    import dtale.views as views
+
+    with app.test_client() as c:
+        with ExitStack() as stack:
+            stack.enter_context(mock.patch('dtale.views.DATA', {c.port: test_data}))
+            stack.enter_context(mock.patch('dtale.views.DTYPES', {c.port: views.build_dtypes_state(test_data)}))
+            views.warm_describe_cache(c.port, columns=['security_id', 'baz']).join()
+            assert (c.port, 'security_id') in views.DESCRIBE_CACHE
+            assert (c.port, 'baz') in views.DESCRIBE_CACHE
+
+            stack.enter_context(mock.patch('dtale.views.load_describe', mock.Mock(side_effect=Exception('cached'))))
+            response = c.get('/dtale/describe/{}/{}'.format(c.port, 'security_id'))
+            response_data = json.loads(response.data)
+            assert response_data['success']
+            assert response_data['describe']['count'] == '50'
+
+            response = c.get('/dtale/describe/{}/{}'.format(c.port, 'foo'))
+            response_data = json.loads(response.data)
+            assert response_data['error'] == 'cached'
+
+
+@pytest.mark.unit
+def test_describe_approx(unittest):
+    import dtale.views as views
+
+    df = pd.DataFrame(dict(a=['a', 'b', 'a', None] * 50, b=list(range(150)) + [0] * 50))
+    with app.test_client() as c:
+        with ExitStack() as stack:
+            stack.enter_context(mock.patch('dtale.views.DATA', {c.port: df}))
+            stack.enter_context(mock.patch('dtale.views.DTYPES', {c.port: views.build_dtypes_state(df)}))
+            response = c.get('/dtale/describe/{}/a'.format(c.port), query_string=dict(approx='true'))
+            response_data = json.loads(response.data)
+            unittest.assertEqual(response_data['describe'], {'count': '150', 'unique': '2', 'top': 'a', 'freq': '100'})
+            unittest.assertEqual(response_data['uniques'], {'data': ['a', 'b'], 'top': False})
+            assert not response_data['approximate']
+
+            with mock.patch('pandas.Series.mode', mock.Mock(side_effect=Exception('mode should come from sketch'))):
+                response = c.get('/dtale/describe/{}/b'.format(c.port), query_string=dict(approx='true'))
+            response_data = json.loads(response.data)
+            assert response_data['describe']['unique'] == '150'
+            assert response_data['describe']['mode'] == '0'
+            approx_describe = response_data['describe']
+            assert response_data['uniques']['top'] and response_data['uniques']['data'][0] == 0
+            assert (c.port, ('b', 'approx')) in views.DESCRIBE_CACHE
+
+            response = c.get('/dtale/describe/{}/b'.format(c.port))
+            response_data = json.loads(response.data)
+            assert 'approximate' not in response_data
+            unittest.assertEqual(approx_describe, response_data['describe'], 'exact column should match')
+
+
+@pytest.mark.unit
+def test_build_date_metadata(unittest):
+    from dtale.views import build_date_metadata
+
+    dates = pd.Series(pd.to_datetime(['2000-01-01', '2000-01-01', '2000-01-02', None, '2000-01-03']))
+    unittest.assertEqual(build_date_metadata(dates), dict(count=4, unique=3, repeated=1))
+    unittest.assertEqual(build_date_metadata(pd.Series([pd.NaT])), dict(count=0, unique=0, repeated=0))
+
+
+@pytest.mark.unit
+def test_date_positions():
+    import dtale.views as views
+
+    df = pd.DataFrame(dict(
+        date=pd.to_datetime(['2000-01-02', '2000-01-01', None, '2000-01-02', '2000-01-03']),
+        str_date=['20000102', '20000101', None, '20000102', '20000103'],
+    ))
+    with mock.patch('dtale.views.DATA', {'1': df}):
+        np.testing.assert_array_equal(views.date_positions('1', 'date', '20000102'), [0, 3])
+        assert views.DATE_INDEX_CACHE.get('1', 'date', data=df) is not None
+        np.testing.assert_array_equal(views.date_positions('1', 'date', '2000-01-03'), [4])
+        assert not len(views.date_positions('1', 'date', '20000104'))
+        np.testing.assert_array_equal(views.date_positions('1', 'str_date', '20000102'), [0, 3])
+
+
 @pytest.mark.unit
 def test_test_filter(test_data):
     with app.test_client() as c:
@@ -296,6 +374,32 @@ def test_test_filter(test_data):
             assert 'error' in response_data
 
 
+@pytest.mark.unit
+def test_in_place_edits(unittest):
+    import dtale.views as views
+
+    df, _ = views.format_data(pd.DataFrame(dict(a=[3, 1, 2], b=[1.0, 2.0, 3.0])))
+    with app.test_client() as c:
+        with ExitStack() as stack:
+            stack.enter_context(mock.patch('dtale.views.DATA', {c.port: df}))
+            stack.enter_context(mock.patch('dtale.views.DTYPES', {c.port: views.build_dtypes_state(df)}))
+            params = dict(ids=json.dumps(['0']), sort=json.dumps([['a', 'ASC']]))
+            response = c.get('/dtale/data/{}'.format(c.port), query_string=params)
+            assert json.loads(response.data)['results']['0']['a'] == 1
+            response = c.get('/dtale/describe/{}/a'.format(c.port))
+            assert json.loads(response.data)['describe']['max'] == '3'
+
+            df['a'] = [5, 7, 6]  # edit an existing column of the data being served
+            response = c.get('/dtale/data/{}'.format(c.port), query_string=params)
+            assert json.loads(response.data)['results']['0']['a'] == 5, 'should re-sort edited data'
+            response = c.get('/dtale/describe/{}/a'.format(c.port))
+            assert json.loads(response.data)['describe']['max'] == '7', 'should re-describe edited data'
+
+            df.loc[1, 'b'] = 10.0
+            response = c.get('/dtale/histogram/{}'.format(c.port), query_string=dict(col='b', bins=5))
+            assert json.loads(response.data)['desc']['max'] == '10'
+
+
 @pytest.mark.unit
 def test_get_data(unittest, test_data):
     import dtale.views as views
@@ -333,6 +437,15 @@ def test_get_data(unittest, test_data):
             }
             unittest.assertEqual(response_data['results'], expected, 'should return data at indexes 1-2')
 
+            params = dict(ids=json.dumps(['1-2', '4']), columnar='true')
+            response = c.get('/dtale/data/{}'.format(c.port), query_string=params)
+            response_data = json.loads(response.data)
+            expected = dict(
+                date=['2000-01-01'] * 3, security_id=[1, 2, 4], dtale_index=[1, 2, 4], foo=[1] * 3,
+                bar=[1.5] * 3, baz=['baz'] * 3
+            )
+            unittest.assertEqual(response_data['results'], expected, 'should return columnar data')
+
             params = dict(ids=json.dumps(['1']), sort=json.dumps([['security_id', 'DESC']]))
             response = c.get('/dtale/data/{}'.format(c.port), query_string=params)
             response_data = json.loads(response.data)
@@ -354,6 +467,25 @@ def test_get_data(unittest, test_data):
             unittest.assertEqual(response_data['results'], expected, 'should return data at index 1 w/ sort')
             unittest.assertEqual(views.SETTINGS[c.port], {'query': 'security_id == 1'}, 'should update settings')
 
+            params = dict(ids=json.dumps(['0-1']), sort=json.dumps([['security_id', 'DESC']]), query='security_id < 3')
+            response = c.get('/dtale/data/{}'.format(c.port), query_string=params)
+            response_data = json.loads(response.data)
+            unittest.assertEqual(
+                [response_data['results'][k]['security_id'] for k in ['0', '1']], [2, 1],
+                'should return sorted & filtered data'
+            )
+            assert response_data['total'] == 3
+            unittest.assertEqual(
+                list(views.DATA[c.port]['security_id'].values[:3]), [0, 1, 2], 'should not alter stored data'
+            )
+            assert (c.port, json.dumps([['security_id', 'DESC']])) in views.SORT_CACHE
+
+            with mock.patch('dtale.views.build_filter_mask', mock.Mock(side_effect=Exception('should be cached'))):
+                params['ids'] = json.dumps(['2'])
+                response = c.get('/dtale/data/{}'.format(c.port), query_string=params)
+                response_data = json.loads(response.data)
+                assert response_data['results']['2']['security_id'] == 0
+
     with app.test_client() as c:
         with ExitStack() as stack:
             stack.enter_context(mock.patch('dtale.views.DATA', {c.port: test_data}))
@@ -393,6 +525,8 @@ def test_get_data(unittest, test_data):
 
 @pytest.mark.unit
 def test_get_histogram(unittest, test_data):
+    import dtale.views as views
+
     with app.test_client() as c:
         with mock.patch('dtale.views.DATA', {c.port: test_data}):
             response = c.get('/dtale/histogram/{}'.format(c.port), query_string=dict(col='foo'))
@@ -432,6 +566,23 @@ def test_get_histogram(unittest, test_data):
             )
             unittest.assertEqual(response_data, expected, 'should return a filtered 5-bin histogram for foo')
 
+            assert (c.port, ('foo', 'security_id > 10')) in views.HISTOGRAM_CACHE
+            with mock.patch('numpy.histogram', mock.Mock(side_effect=Exception('histogram failure'))):
+                response = c.get('/dtale/histogram/{}'.format(c.port),
+                                 query_string=dict(col='foo', bins=10, query='security_id > 10'))
+                response_data = json.loads(response.data)
+                assert sum(response_data['data']) == 39, 'should use cached preset histograms'
+
+                response = c.get('/dtale/histogram/{}'.format(c.port),
+                                 query_string=dict(col='foo', bins=7, query='security_id > 10'))
+                assert json.loads(response.data)['error'] == 'histogram failure'
+
+            response = c.get('/dtale/histogram/{}'.format(c.port),
+                             query_string=dict(col='foo', bins=7, query='security_id > 10'))
+            response_data = json.loads(response.data)
+            assert len(response_data['data']) == 7 and sum(response_data['data']) == 39
+            assert (c.port, ('foo', 'security_id > 10', 7)) in views.HISTOGRAM_CACHE
+
     with app.test_client() as c:
         with ExitStack() as stack:
             stack.enter_context(mock.patch('dtale.views.DATA', {c.port: test_data}))
@@ -441,6 +592,17 @@ def test_get_histogram(unittest, test_data):
             response_data = json.loads(response.data)
             unittest.assertEqual(response_data['error'], 'histogram failure', 'should handle histogram exception')
 
+    df = pd.DataFrame(dict(a=np.random.randn(1000)))
+    df.loc[::7, 'a'] = np.nan
+    expected = views.load_describe(df['a'])
+    with app.test_client() as c:
+        with ExitStack() as stack:
+            stack.enter_context(mock.patch('dtale.views.DATA', {c.port: df}))
+            stack.enter_context(mock.patch('pandas.Series.describe', mock.Mock(side_effect=Exception('copied column'))))
+            response = c.get('/dtale/histogram/{}'.format(c.port), query_string=dict(col='a'))
+            response_data = json.loads(response.data)
+            unittest.assertEqual(response_data['desc'], expected, 'should describe numeric columns in chunks')
+
 
 @pytest.mark.unit
 def test_get_correlations(unittest, test_data, rolling_data):
@@ -464,6 +626,12 @@ def test_get_correlations(unittest, test_data, rolling_data):
             )
             unittest.assertEqual(response_data, expected, 'should return correlations')
 
+            assert (c.port, None) in views.CORRELATIONS_CACHE
+            with mock.patch('numpy.corrcoef', mock.Mock(side_effect=Exception('should be cached'))):
+                response = c.get('/dtale/correlations/{}'.format(c.port))
+                response_data = json.loads(response.data)
+                unittest.assertEqual(response_data, expected, 'should return cached correlations')
+
     with app.test_client() as c:
         with ExitStack() as stack:
             stack.enter_context(mock.patch('dtale.views.DATA', {c.port: test_data}))
@@ -494,6 +662,22 @@ def test_get_correlations(unittest, test_data, rolling_data):
                 rolling=False
             )
             unittest.assertEqual(response_data, expected, 'should return correlations')
+            unittest.assertEqual(
+                views.DATE_METADATA_CACHE.get(c.port, 'date'), dict(count=100, unique=2, repeated=2)
+            )
+
+    df = pd.DataFrame(dict(a=[1.0, 2, 3, np.nan, 5], b=[True, False, True, True, False], c=[2.0, 1, 4, 3, 5]))
+    with app.test_client() as c:
+        with ExitStack() as stack:
+            stack.enter_context(mock.patch('dtale.views.DATA', {c.port: df}))
+            stack.enter_context(mock.patch('dtale.views.DTYPES', {c.port: views.build_dtypes_state(df)}))
+            response = c.get('/dtale/correlations/{}'.format(c.port))
+            response_data = json.loads(response.data)
+            expected = df.astype('float64').corr()
+            assert [row['column'] for row in response_data['data']] == ['a', 'b', 'c'], 'should include bools'
+            for row in response_data['data']:
+                for col in ['a', 'b', 'c']:
+                    assert row[col] == pytest.approx(expected.loc[row['column'], col], abs=1e-4)
 
     df, _ = views.format_data(rolling_data)
     with app.test_client() as c:
@@ -643,6 +827,15 @@ def test_get_scatter(unittest, rolling_data):
             )
             unittest.assertEqual(response_data, expected, 'should return scatter')
 
+            params['sample'] = 'true'
+            response = c.get('/dtale/scatter/{}'.format(c.port), query_string=params)
+            response_data = json.loads(response.data)
+            unittest.assertEqual(response_data['stats'], expected['stats'], 'stats should use all data')
+            assert response_data['sampled']
+            assert len(response_data['data']['all']['x']) <= 15000
+            assert response_data['sample_rate'] == len(response_data['data']['all']['x']) / 15001.0
+            assert views.RANKS_CACHE.get(c.port, 'foo', data=test_data) is not None, 'should cache rank order'
+
     with app.test_client() as c:
         with ExitStack() as stack:
             stack.enter_context(mock.patch('dtale.views.DATA', {c.port: test_data}))
@@ -681,6 +874,15 @@ def test_get_chart_data(unittest, test_data, rolling_data):
             }
             unittest.assertEqual(response_data, expected, 'should return chart data')
 
+            with mock.patch('dtale.views.build_chart', mock.Mock(side_effect=Exception('should use cache'))):
+                params['query'] = ' '
+                response = c.get('/dtale/chart-data/{}'.format(c.port), query_string=params)
+                unittest.assertEqual(json.loads(response.data), expected, 'should return cached chart data')
+
+            views.CHART_CACHE.clear(c.port)
+            response = c.get('/dtale/chart-data/{}'.format(c.port), query_string=params)
+            unittest.assertEqual(json.loads(response.data), expected, 'should ignore blank queries on a cold cache')
+
     test_data.loc[:, 'baz'] = 'baz'
 
     with app.test_client() as c: